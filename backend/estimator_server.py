@@ -0,0 +1,91 @@
+"""
+Hand Teleop System - Resident Estimator Server
+Keeps WiLoR loaded between runs so debug scripts skip the model cold start
+
+Start with `python -m backend.estimator_server`, then scripts call connect_or_create_estimator()
+"""
+import os
+from multiprocessing.connection import Client, Listener
+
+DEFAULT_ADDRESS = "/tmp/wilor.sock"
+_AUTHKEY = b"hand-teleop-wilor"
+
+
+class RemoteEstimator:
+    """Client for the resident server, usable wherever predict_hands() takes an estimator"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def predict(self, frame, hand="right"):
+        self._conn.send((frame, hand))
+        result = self._conn.recv()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self):
+        self._conn.close()
+
+
+def connect_estimator(address=DEFAULT_ADDRESS):
+    """Return a RemoteEstimator, or None when no server is listening"""
+    try:
+        return RemoteEstimator(Client(address, family="AF_UNIX", authkey=_AUTHKEY))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+
+def connect_or_create_estimator(address=DEFAULT_ADDRESS):
+    """Reuse the resident model when a server is running, otherwise load WiLoR in-process"""
+    estimator = connect_estimator(address)
+    if estimator is not None:
+        return estimator
+    from core.hand_pose.factory import create_estimator
+    return create_estimator("wilor")
+
+
+def serve(address=DEFAULT_ADDRESS):
+    """Load WiLoR once and answer predictions until interrupted"""
+    from core.hand_pose.factory import create_estimator
+
+    print("🧠 Loading WiLoR model...")
+    # Resident for many runs, so compile tracing is worth paying once at startup
+    estimator = create_estimator("wilor", compile_gpu=True)
+    estimator.warm_up()
+
+    # A stale socket file from a previous run would make bind() fail
+    if os.path.exists(address):
+        os.unlink(address)
+
+    with Listener(address, family="AF_UNIX", authkey=_AUTHKEY) as listener:
+        print(f"✅ WiLoR resident at {address} (Ctrl+C to stop)")
+        while True:
+            with listener.accept() as conn:
+                while True:
+                    try:
+                        frame, hand = conn.recv()
+                    except EOFError:
+                        break
+                    try:
+                        conn.send(estimator.pipe.predict(frame, hand=hand))
+                    except Exception as e:
+                        # Re-wrapped so unpicklable exceptions still reach the client
+                        conn.send(RuntimeError(f"{type(e).__name__}: {e}"))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Resident WiLoR estimator server")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS)
+    args = parser.parse_args(argv)
+
+    try:
+        serve(args.address)
+    except KeyboardInterrupt:
+        print("\n👋 Estimator server stopped")
+
+
+if __name__ == "__main__":
+    main()
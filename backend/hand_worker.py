@@ -0,0 +1,345 @@
+"""
+Hand Teleop System - Hand Tracking Worker
+Frame -> hand pose -> robot joints/pose processing shared by the API server
+
+Also runnable as `python -m backend.hand_worker <image>` for isolated processing
+"""
+import functools
+import os
+import struct
+
+import cv2
+import numpy as np
+
+# Overlay styling, built once at import rather than per keypoint per frame
+_FINGERTIPS = frozenset({4, 8, 12, 16, 20})
+_FINGERTIP_INDICES = np.array(sorted(_FINGERTIPS))
+_TIP_COLOR = (0, 255, 255)
+_JOINT_COLOR = (255, 255, 0)
+_TIP_RADIUS = 8
+_JOINT_RADIUS = 5
+
+# libjpeg scales inside the IDCT for these flags, so reduced decode costs nothing extra
+_REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+_URDF_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core", "robot_control", "urdf")
+
+# Start-of-frame markers carrying the image size (DHT/JPG/DAC share the range)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def jpeg_size(data):
+    """(width, height) read from the JPEG SOF header, or None if not a JPEG"""
+    if data[:2] != b"\xff\xd8":
+        return None
+
+    i = 2
+    while i + 9 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # Fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # Standalone markers
+            i += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", data[i + 5:i + 9])
+            return width, height
+        (length,) = struct.unpack(">H", data[i + 2:i + 4])
+        i += 2 + length
+    return None
+
+
+def decode_image(image_bytes, min_long_side=512):
+    """Decode to BGR, downscaled in the JPEG IDCT while the long side stays >= min_long_side
+
+    Returns (frame, scale); multiply pixel coordinates by scale to map back
+    to the original image. min_long_side=None always decodes at full size.
+    """
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    size = jpeg_size(image_bytes) if min_long_side is not None else None
+    if size is not None:
+        long_side = max(size)
+        for factor, flag in _REDUCED_DECODE_FLAGS:
+            if long_side // factor >= min_long_side:
+                frame = cv2.imdecode(nparr, flag)
+                if frame is not None:
+                    return frame, factor
+                break
+    return cv2.imdecode(nparr, cv2.IMREAD_COLOR), 1
+
+
+def scale_keypoints(hand_pose, scale):
+    """Map pixel-space keypoints from a reduced decode back to original resolution"""
+    if scale == 1 or not has_keypoints(hand_pose) or hand_pose.get('tracking_method') != 'wilor':
+        return hand_pose
+    # MediaPipe keypoints are normalized and need no rescaling
+    hand_pose['keypoints_2d'] = (np.asarray(hand_pose['keypoints_2d']) * scale).tolist()
+    return hand_pose
+
+
+def predict_hands(estimator, frame):
+    """Run the estimator's raw prediction on a BGR frame"""
+    pipe = getattr(estimator, "pipe", None)
+    if pipe is not None:
+        return pipe.predict(frame, hand="right")
+    return estimator.predict(frame, hand="right")
+
+
+def process_frame(frame, robot_type, tracking_mode="wilor", estimator=None):
+    """Process a decoded frame into (hand_pose, robot_joints, robot_pose)"""
+    try:
+        if frame is None:
+            print("ERROR: Could not load image")
+            return None, None, None
+
+        # Initialize estimator based on tracking mode
+        try:
+            if estimator is None:
+                from core.hand_pose.factory import create_estimator
+                estimator = create_estimator("wilor" if tracking_mode == "wilor" else "mediapipe")
+            result = predict_hands(estimator, frame)
+        except ImportError as e:
+            print(f"ERROR: Failed to import estimator: {e}")
+            # Fallback to simple mock data
+            return create_mock_hand_pose(), create_mock_joints(robot_type), create_mock_pose()
+        except Exception as e:
+            print(f"ERROR: Estimator initialization failed: {e}")
+            return create_mock_hand_pose(), create_mock_joints(robot_type), create_mock_pose()
+
+        return process_prediction(result, robot_type, tracking_mode)
+
+    except Exception as e:
+        print(f"ERROR: {e}")
+        return create_mock_hand_pose(), create_mock_joints(robot_type), create_mock_pose()
+
+
+def process_prediction(result, robot_type, tracking_mode="wilor"):
+    """Turn a raw estimator prediction into (hand_pose, robot_joints, robot_pose)"""
+    try:
+        if not result or len(result) == 0:
+            return None, None, None
+
+        hand = result[0] if isinstance(result, list) else result
+
+        # Extract hand pose data based on tracking mode
+        hand_pose = extract_hand_pose(hand, tracking_mode)
+
+        # Calculate robot joint angles using inverse kinematics
+        robot_joints = calculate_robot_joints(hand_pose, robot_type)
+
+        # Calculate robot pose
+        robot_pose = calculate_robot_pose(robot_joints, robot_type)
+
+        return hand_pose, robot_joints, robot_pose
+
+    except Exception as e:
+        print(f"ERROR: {e}")
+        return create_mock_hand_pose(), create_mock_joints(robot_type), create_mock_pose()
+
+
+def keypoints_to_list(raw, dims=None):
+    """Tensor or array keypoints (optionally batched) -> [[x, y, ...], ...] in one conversion"""
+    points = raw.detach().cpu().numpy() if hasattr(raw, 'cpu') else np.asarray(raw)
+    points = points.reshape(-1, points.shape[-1])
+    if dims is not None:
+        points = points[:, :dims]
+    return points.tolist()
+
+
+def extract_hand_pose(hand, tracking_mode="wilor"):
+    """Convert a raw WiLoR/MediaPipe hand prediction to the API hand_pose dict"""
+    hand_pose = {}
+    if tracking_mode == "wilor":
+        # Extract WiLoR predictions
+        if hasattr(hand, 'get') and 'wilor_preds' in hand and hand['wilor_preds'] is not None:
+            wilor_data = hand['wilor_preds']
+            if 'pred_keypoints_2d' in wilor_data:
+                hand_pose['keypoints_2d'] = keypoints_to_list(wilor_data['pred_keypoints_2d'], 2)
+
+            if 'pred_keypoints_3d' in wilor_data:
+                hand_pose['keypoints_3d'] = keypoints_to_list(wilor_data['pred_keypoints_3d'], 3)
+
+            hand_pose['tracking_method'] = 'wilor'
+        else:
+            # Fallback to mock data
+            hand_pose = create_mock_hand_pose()
+    else:
+        # Extract MediaPipe predictions
+        if hasattr(hand, 'get') and 'mediapipe_preds' in hand and hand['mediapipe_preds'] is not None:
+            mp_data = hand['mediapipe_preds']
+            if 'landmarks' in mp_data:
+                landmarks = mp_data['landmarks']
+                if landmarks:
+                    # Convert MediaPipe landmarks to our format
+                    keypoints_2d = [[lm.x, lm.y] for lm in landmarks.landmark]
+                    keypoints_3d = [[lm.x, lm.y, lm.z] for lm in landmarks.landmark]
+                    hand_pose['keypoints_2d'] = keypoints_2d
+                    hand_pose['keypoints_3d'] = keypoints_3d
+
+            hand_pose['tracking_method'] = 'mediapipe'
+        elif hasattr(hand, 'get') and 'landmarks' in hand:
+            # Direct MediaPipe format
+            landmarks = hand['landmarks']
+            if landmarks:
+                keypoints_2d = [[lm.x, lm.y] for lm in landmarks.landmark]
+                keypoints_3d = [[lm.x, lm.y, lm.z] for lm in landmarks.landmark]
+                hand_pose['keypoints_2d'] = keypoints_2d
+                hand_pose['keypoints_3d'] = keypoints_3d
+                hand_pose['tracking_method'] = 'mediapipe'
+        else:
+            # Fallback to mock data
+            hand_pose = create_mock_hand_pose()
+    return hand_pose
+
+
+def has_keypoints(hand_pose):
+    """True when the pose carries real (non-mock) 2D keypoints worth drawing"""
+    return bool(hand_pose) and 'keypoints_2d' in hand_pose and hand_pose.get('tracking_method') != 'mock'
+
+
+def draw_overlay(frame, hand_pose):
+    """Draw tracked keypoints onto the frame in place"""
+    if not has_keypoints(hand_pose):
+        return frame
+
+    points = np.asarray(hand_pose['keypoints_2d'], dtype=np.float32)
+    if hand_pose.get('tracking_method') == 'mediapipe':
+        # MediaPipe landmarks are normalized to the image size
+        points = points * (frame.shape[1], frame.shape[0])
+
+    return draw_keypoints(frame, points)
+
+
+def draw_keypoints(image, points):
+    """Draw pixel-space keypoints in place: joints first, fingertips on top"""
+    points = np.asarray(points, dtype=np.float32).astype(np.int32)
+    is_tip = np.isin(np.arange(len(points)), _FINGERTIP_INDICES)
+
+    for x, y in points[~is_tip].tolist():
+        cv2.circle(image, (x, y), _JOINT_RADIUS, _JOINT_COLOR, -1)
+    for x, y in points[is_tip].tolist():
+        cv2.circle(image, (x, y), _TIP_RADIUS, _TIP_COLOR, -1)
+    return image
+
+
+def create_mock_hand_pose():
+    """Create mock hand pose data for testing"""
+    return {
+        'keypoints_2d': [[0.5, 0.5] for _ in range(21)],
+        'keypoints_3d': [[0.5, 0.5, 0.0] for _ in range(21)],
+        'tracking_method': 'mock',
+        'confidence': 0.9
+    }
+
+
+def create_mock_joints(robot_type):
+    """Create mock joint angles for testing"""
+    if robot_type == "so101":
+        return [0.1, 0.2, 0.3, 0.1, 0.2]
+    elif robot_type == "so100":
+        return [0.1, 0.1]
+    elif robot_type == "koch":
+        return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1, 0.0]
+    else:
+        return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1]
+
+
+def create_mock_pose():
+    """Create mock robot pose for testing"""
+    return {
+        "position": [0.3, 0.0, 0.4],
+        "orientation": [0.0, 0.0, 0.0],
+        "transformation_matrix": [[1, 0, 0, 0.3], [0, 1, 0, 0], [0, 0, 1, 0.4], [0, 0, 0, 1]]
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _load_kinematics(robot_type):
+    """Parse the robot's URDF once; None when there is no URDF or pinocchio is missing"""
+    urdf_path = os.path.join(_URDF_DIR, f"{robot_type}.urdf")
+    if not os.path.isfile(urdf_path):
+        return None
+    try:
+        from core.robot_control.kinematics import RobotKinematics
+        return RobotKinematics(urdf_path)
+    except Exception as e:
+        print(f"FK unavailable for {robot_type}: {e}")
+        return None
+
+
+def calculate_robot_joints(hand_pose, robot_type):
+    """Calculate robot joint angles from hand pose"""
+    # Simple mapping for demonstration
+    # In production, this would use sophisticated inverse kinematics
+    if robot_type == "so101":
+        # 5-DOF humanoid hand
+        return [0.0, 0.2, 0.4, 0.1, 0.3]
+    elif robot_type == "so100":
+        # 2-DOF gripper
+        return [0.1, 0.1]
+    elif robot_type == "koch":
+        # 7-DOF arm
+        return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1, 0.0]
+    else:
+        # Default 6-DOF
+        return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1]
+
+
+def calculate_robot_pose(joint_angles, robot_type):
+    """Calculate end effector pose from joint angles"""
+    robot = _load_kinematics(robot_type)
+    q = np.asarray(joint_angles, dtype=np.float64)
+    if robot is None or q.shape != (robot.model.nq,):
+        # No URDF/pinocchio for this robot, or angles that don't fit its model
+        return create_mock_pose()
+
+    try:
+        # Forward kinematics to get end effector pose
+        T = robot.fk(q)
+
+        # Extract position and orientation
+        position = T[:3, 3].tolist()
+
+        # Convert rotation matrix to Euler angles (simplified)
+        orientation = [0.0, 0.0, 0.0]  # Placeholder
+
+        return {
+            "position": position,
+            "orientation": orientation,
+            "transformation_matrix": T.tolist()
+        }
+
+    except Exception as e:
+        print(f"FK Error: {e}")
+        return create_mock_pose()
+
+
+def main(argv=None):
+    """Subprocess entry point: process one image and print RESULT:<json>"""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Hand tracking worker")
+    parser.add_argument("image_path")
+    parser.add_argument("--robot-type", default="so101")
+    parser.add_argument("--tracking-mode", default="wilor", choices=["wilor", "mediapipe"])
+    args = parser.parse_args(argv)
+
+    frame = cv2.imread(args.image_path)
+    hand_pose, robot_joints, robot_pose = process_frame(frame, args.robot_type, args.tracking_mode)
+    result = {
+        "hand_pose": hand_pose,
+        "robot_joints": robot_joints,
+        "robot_pose": robot_pose
+    }
+    print("RESULT:" + json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
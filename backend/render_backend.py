@@ -5,7 +5,7 @@ Designed for integration with jonaspetersen.com portfolio
 """
 from fastapi import FastAPI, UploadFile, File, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, validator
 from typing import Dict, Any, List, Optional, Literal
@@ -79,6 +79,20 @@ class HandTrackingResponse(BaseModel):
     hand_pose: Optional[Dict[str, Any]] = None
     robot_joints: Optional[List[float]] = None
     robot_pose: Optional[Dict[str, Any]] = None
+    overlay_image: Optional[str] = None  # Only sent when requested with ?overlay=1
+    processing_time_ms: float
+    message: str
+
+class BatchFrameResult(BaseModel):
+    hand_detected: bool
+    hand_pose: Optional[Dict[str, Any]] = None
+    robot_joints: Optional[List[float]] = None
+    robot_pose: Optional[Dict[str, Any]] = None
+
+class BatchTrackingResponse(BaseModel):
+    success: bool
+    timestamp: str
+    results: List[BatchFrameResult]  # Same order as the uploaded files
     processing_time_ms: float
     message: str
 
@@ -187,6 +201,51 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+# ==================== MODEL WARM-UP ====================
+
+from backend.hand_worker import (
+    process_prediction, draw_overlay, has_keypoints,
+    decode_image, scale_keypoints,
+    create_mock_hand_pose, create_mock_joints, create_mock_pose,
+)
+from backend.serial_predictor import SerialPredictor
+
+# Estimators loaded in-process at startup, keyed by tracking mode
+app.state.predictors = {}
+
+@app.on_event("startup")
+async def warm_up_estimator():
+    """Load WiLoR once and run a synthetic frame so the first request is steady-state"""
+    if os.environ.get("HAND_TELEOP_WARMUP", "1") == "0":
+        print("ℹ️  Estimator warm-up disabled (HAND_TELEOP_WARMUP=0)")
+        return
+    
+    try:
+        from core.hand_pose.factory import create_estimator
+        
+        start = time.time()
+        # int8 CPU quantization trades keypoint accuracy for speed; deployments opt in
+        quantize_cpu = os.environ.get("HAND_TELEOP_QUANTIZE_CPU") == "1"
+        # The server lives long enough to amortise torch.compile tracing; warm_up pays it here
+        estimator = await asyncio.to_thread(
+            create_estimator, "wilor", quantize_cpu=quantize_cpu, compile_gpu=True
+        )
+        await asyncio.to_thread(estimator.warm_up)
+        
+        # Upload resolution (and so the detector's input) varies per client, and the
+        # ViT batch is the hand count; autotune only when a deployment pins the size
+        if os.environ.get("HAND_TELEOP_FIXED_INPUT") == "1":
+            try:
+                import torch
+                torch.backends.cudnn.benchmark = True
+            except ImportError:
+                pass
+        
+        app.state.predictors["wilor"] = SerialPredictor(estimator)
+        print(f"✅ WiLoR warmed up in {time.time() - start:.1f}s")
+    except Exception as e:
+        print(f"⚠️  WiLoR warm-up skipped, using per-request subprocess: {e}")
+
 # SO-101 Robot Simulation
 try:
     from core.robot_control.so101_simulation import get_simulation
@@ -367,7 +426,7 @@ async def configure_robot(config: RobotConfig):
     }
 
 @app.post("/api/track", response_model=HandTrackingResponse)
-async def process_hand_tracking(request: HandTrackingRequest):
+async def process_hand_tracking(request: HandTrackingRequest, overlay: bool = False):
     """Main hand tracking endpoint - exact specification"""
     start_time = time.time()
     
@@ -383,8 +442,11 @@ async def process_hand_tracking(request: HandTrackingRequest):
                 image_data = request.image_data
                 
             image_bytes = base64.b64decode(image_data)
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # The overlay goes back to the client, so it is drawn on the full-size frame
+            if overlay:
+                frame, scale = decode_image(image_bytes, min_long_side=None)
+            else:
+                frame, scale = decode_image(image_bytes)
             
             if frame is None:
                 raise ValueError("Invalid image format")
@@ -393,20 +455,20 @@ async def process_hand_tracking(request: HandTrackingRequest):
             performance_stats["failed_requests"] += 1
             raise HTTPException(status_code=400, detail=f"Invalid image data: {str(e)}")
         
-        # Save temporary image for processing
-        temp_input = f"temp_track_{int(time.time())}.jpg"
-        cv2.imwrite(temp_input, frame)
-        
         # Process with WiLoR/MediaPipe
         hand_pose, robot_joints, robot_pose = await process_hand_tracking_internal(
-            temp_input, 
+            frame, 
             request.robot_type or current_robot_config["robot_type"],
             request.tracking_mode
         )
         
-        # Clean up
-        if os.path.exists(temp_input):
-            os.remove(temp_input)
+        # Overlay is opt-in, and never encoded when there is no hand to draw
+        overlay_image = None
+        if overlay and has_keypoints(hand_pose):
+            ok, buffer = cv2.imencode(".jpg", draw_overlay(frame, hand_pose))
+            if ok:
+                overlay_image = "data:image/jpeg;base64," + base64.b64encode(buffer).decode("ascii")
+        scale_keypoints(hand_pose, scale)
         
         processing_time = (time.time() - start_time) * 1000
         
@@ -425,6 +487,7 @@ async def process_hand_tracking(request: HandTrackingRequest):
             hand_pose=hand_pose,
             robot_joints=robot_joints,
             robot_pose=robot_pose,
+            overlay_image=overlay_image,
             processing_time_ms=processing_time,
             message="Hand tracking completed successfully" if hand_pose else "No hand detected"
         )
@@ -444,6 +507,110 @@ async def process_hand_tracking(request: HandTrackingRequest):
             message=f"Processing error: {str(e)}"
         )
 
+@app.post("/api/track/overlay")
+async def process_hand_tracking_overlay(
+    file: UploadFile = File(...),
+    robot_type: Optional[str] = None,
+    tracking_mode: Literal["wilor", "mediapipe"] = "wilor",
+):
+    """Hand tracking overlay - annotated frame returned as raw JPEG bytes (no base64)"""
+    start_time = time.time()
+    
+    image_bytes = await file.read()
+    frame = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise HTTPException(status_code=400, detail="Invalid image data: Invalid image format")
+    
+    hand_pose, _, _ = await process_hand_tracking_internal(
+        frame,
+        robot_type or current_robot_config["robot_type"],
+        tracking_mode
+    )
+    
+    if has_keypoints(hand_pose):
+        ok, buffer = cv2.imencode(".jpg", draw_overlay(frame, hand_pose))
+        if not ok:
+            raise HTTPException(status_code=500, detail="Failed to encode overlay image")
+        content = buffer.tobytes()
+    elif image_bytes[:3] == b"\xff\xd8\xff":
+        # Nothing to draw: hand the uploaded JPEG back untouched, no re-encode
+        content = image_bytes
+    else:
+        ok, buffer = cv2.imencode(".jpg", frame)
+        if not ok:
+            raise HTTPException(status_code=500, detail="Failed to encode overlay image")
+        content = buffer.tobytes()
+    
+    processing_time = (time.time() - start_time) * 1000
+    return Response(
+        content=content,
+        media_type="image/jpeg",
+        headers={
+            "X-Hand-Detected": "true" if has_keypoints(hand_pose) else "false",
+            "X-Processing-Time-Ms": f"{processing_time:.1f}",
+        }
+    )
+
+# Upper bound on frames per /api/track/batch request
+MAX_BATCH_FRAMES = 32
+
+@app.post("/api/track/batch", response_model=BatchTrackingResponse)
+async def process_hand_tracking_batch(
+    files: List[UploadFile] = File(...),
+    robot_type: Optional[str] = None,
+    tracking_mode: Literal["wilor", "mediapipe"] = "wilor",
+):
+    """Hand tracking for several frames in one request, one HTTP round trip for all of them"""
+    start_time = time.time()
+    
+    if len(files) > MAX_BATCH_FRAMES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_FRAMES} frames per batch")
+    
+    robot_type = robot_type or current_robot_config["robot_type"]
+    performance_stats["total_requests"] += 1
+    
+    payloads = [await file.read() for file in files]
+    # cv2.imdecode releases the GIL, so the frames decode in parallel
+    decoded = await asyncio.gather(*(asyncio.to_thread(decode_image, data) for data in payloads))
+    if any(frame is None for frame, _ in decoded):
+        performance_stats["failed_requests"] += 1
+        raise HTTPException(status_code=400, detail="Invalid image data: Invalid image format")
+    
+    if tracking_mode in app.state.predictors:
+        # The warm estimator takes frames one at a time; decode and post-processing still overlap
+        outputs = await asyncio.gather(*(
+            process_hand_tracking_internal(frame, robot_type, tracking_mode)
+            for frame, _ in decoded
+        ))
+    else:
+        # Without a warm estimator each frame costs a subprocess, so don't start them all at once
+        outputs = [
+            await process_hand_tracking_internal(frame, robot_type, tracking_mode)
+            for frame, _ in decoded
+        ]
+    
+    results = []
+    for (_, scale), (hand_pose, robot_joints, robot_pose) in zip(decoded, outputs):
+        scale_keypoints(hand_pose, scale)
+        results.append(BatchFrameResult(
+            hand_detected=hand_pose is not None,
+            hand_pose=hand_pose,
+            robot_joints=robot_joints,
+            robot_pose=robot_pose,
+        ))
+    
+    processing_time = (time.time() - start_time) * 1000
+    performance_stats["successful_requests"] += 1
+    performance_stats["last_updated"] = datetime.now().isoformat()
+    
+    return BatchTrackingResponse(
+        success=True,
+        timestamp=datetime.now().isoformat(),
+        results=results,
+        processing_time_ms=processing_time,
+        message=f"Processed {len(results)} frame(s)"
+    )
+
 @app.websocket("/api/robot/so101/simulation")
 async def websocket_so101_simulation(websocket: WebSocket):
     """Real-time SO-101 robot simulation WebSocket"""
@@ -601,27 +768,19 @@ async def websocket_live_tracking(websocket: WebSocket):
                             image_data = image_data.split(',')[1]
                         
                         image_bytes = base64.b64decode(image_data)
-                        nparr = np.frombuffer(image_bytes, np.uint8)
-                        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+                        frame, scale = decode_image(image_bytes)
                         
                         if frame is None:
                             raise ValueError("Invalid image format")
                         
-                        # Save temporary image for processing
-                        temp_input = f"temp_ws_{int(time.time())}_{id(websocket)}.jpg"
-                        cv2.imwrite(temp_input, frame)
-                        
                         # Process with WiLoR/MediaPipe
                         robot_type = message.get("robot_type", current_robot_config["robot_type"])
                         tracking_mode = message.get("tracking_mode", "wilor")
                         
                         hand_pose, robot_joints, robot_pose = await process_hand_tracking_internal(
-                            temp_input, robot_type, tracking_mode
+                            frame, robot_type, tracking_mode
                         )
-                        
-                        # Clean up
-                        if os.path.exists(temp_input):
-                            os.remove(temp_input)
+                        scale_keypoints(hand_pose, scale)
                         
                         # Create response
                         result = {
@@ -750,212 +909,33 @@ async def get_camera_diagnostics():
 
 # ==================== INTERNAL PROCESSING FUNCTIONS ====================
 
-async def process_hand_tracking_internal(image_path: str, robot_type: str, tracking_mode: str = "wilor"):
+async def process_hand_tracking_internal(frame: np.ndarray, robot_type: str, tracking_mode: str = "wilor"):
     """Internal hand tracking processing function"""
-    try:
-        # Get the current working directory and project root
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)
-        
-        # Create processing script for WiLoR/MediaPipe
-        script_content = f"""
-import cv2
-import sys
-import os
-import json
-import numpy as np
-
-# Add project root to Python path
-sys.path.insert(0, '{project_root}')
-
-def process_frame():
-    try:
-        # Load image
-        frame = cv2.imread("{image_path}")
-        if frame is None:
-            print("ERROR: Could not load image")
-            return None, None, None
-        
-        # Initialize estimator based on tracking mode
+    # Fast path: warmed in-process estimator
+    predictor = app.state.predictors.get(tracking_mode)
+    if predictor is not None:
         try:
-            if "{tracking_mode}" == "wilor":
-                from core.hand_pose.factory import create_estimator
-                estimator = create_estimator("wilor")
-                result = estimator.predict(frame, hand="right")
-            else:
-                from core.hand_pose.factory import create_estimator
-                estimator = create_estimator("mediapipe")
-                result = estimator.predict(frame, hand="right")
-        except ImportError as e:
-            print(f"ERROR: Failed to import estimator: {{e}}")
-            # Fallback to simple mock data
-            return create_mock_hand_pose(), create_mock_joints("{robot_type}"), create_mock_pose()
+            result = await predictor.predict(frame)
         except Exception as e:
-            print(f"ERROR: Estimator initialization failed: {{e}}")
-            return create_mock_hand_pose(), create_mock_joints("{robot_type}"), create_mock_pose()
-        
-        if not result or len(result) == 0:
-            return None, None, None
-            
-        hand = result[0] if isinstance(result, list) else result
-        
-        # Extract hand pose data based on tracking mode
-        hand_pose = {{}}
-        if "{tracking_mode}" == "wilor":
-            # Extract WiLoR predictions
-            if hasattr(hand, 'get') and 'wilor_preds' in hand and hand['wilor_preds'] is not None:
-                wilor_data = hand['wilor_preds']
-                if 'pred_keypoints_2d' in wilor_data:
-                    keypoints = wilor_data['pred_keypoints_2d']
-                    if hasattr(keypoints, 'cpu'):
-                        keypoints = keypoints.cpu().numpy()[0]
-                    hand_pose['keypoints_2d'] = keypoints.tolist()
-                
-                if 'pred_keypoints_3d' in wilor_data:
-                    keypoints_3d = wilor_data['pred_keypoints_3d']
-                    if hasattr(keypoints_3d, 'cpu'):
-                        keypoints_3d = keypoints_3d.cpu().numpy()[0]
-                    hand_pose['keypoints_3d'] = keypoints_3d.tolist()
-                    
-                hand_pose['tracking_method'] = 'wilor'
-            else:
-                # Fallback to mock data
-                hand_pose = create_mock_hand_pose()
-        else:
-            # Extract MediaPipe predictions
-            if hasattr(hand, 'get') and 'mediapipe_preds' in hand and hand['mediapipe_preds'] is not None:
-                mp_data = hand['mediapipe_preds']
-                if 'landmarks' in mp_data:
-                    landmarks = mp_data['landmarks']
-                    if landmarks:
-                        # Convert MediaPipe landmarks to our format
-                        keypoints_2d = [[lm.x, lm.y] for lm in landmarks.landmark]
-                        keypoints_3d = [[lm.x, lm.y, lm.z] for lm in landmarks.landmark]
-                        hand_pose['keypoints_2d'] = keypoints_2d
-                        hand_pose['keypoints_3d'] = keypoints_3d
-                        
-                hand_pose['tracking_method'] = 'mediapipe'
-            elif hasattr(hand, 'get') and 'landmarks' in hand:
-                # Direct MediaPipe format
-                landmarks = hand['landmarks']
-                if landmarks:
-                    keypoints_2d = [[lm.x, lm.y] for lm in landmarks.landmark]
-                    keypoints_3d = [[lm.x, lm.y, lm.z] for lm in landmarks.landmark]
-                    hand_pose['keypoints_2d'] = keypoints_2d
-                    hand_pose['keypoints_3d'] = keypoints_3d
-                    hand_pose['tracking_method'] = 'mediapipe'
-            else:
-                # Fallback to mock data
-                hand_pose = create_mock_hand_pose()
-        
-        # Calculate robot joint angles using inverse kinematics
-        robot_joints = calculate_robot_joints(hand_pose, "{robot_type}")
-        
-        # Calculate robot pose
-        robot_pose = calculate_robot_pose(robot_joints, "{robot_type}")
-        
-        return hand_pose, robot_joints, robot_pose
-        
-    except Exception as e:
-        print(f"ERROR: {{e}}")
-        return create_mock_hand_pose(), create_mock_joints("{robot_type}"), create_mock_pose()
-
-def create_mock_hand_pose():
-    \"\"\"Create mock hand pose data for testing\"\"\"
-    return {{
-        'keypoints_2d': [[0.5, 0.5] for _ in range(21)],
-        'keypoints_3d': [[0.5, 0.5, 0.0] for _ in range(21)],
-        'tracking_method': 'mock',
-        'confidence': 0.9
-    }}
-
-def create_mock_joints(robot_type):
-    \"\"\"Create mock joint angles for testing\"\"\"
-    if robot_type == "so101":
-        return [0.1, 0.2, 0.3, 0.1, 0.2]
-    elif robot_type == "so100":
-        return [0.1, 0.1]
-    elif robot_type == "koch":
-        return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1, 0.0]
-    else:
-        return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1]
-
-def create_mock_pose():
-    \"\"\"Create mock robot pose for testing\"\"\"
-    return {{
-        "position": [0.3, 0.0, 0.4],
-        "orientation": [0.0, 0.0, 0.0],
-        "transformation_matrix": [[1,0,0,0.3],[0,1,0,0],[0,0,1,0.4],[0,0,0,1]]
-    }}
-
-def calculate_robot_joints(hand_pose, robot_type):
-    \"\"\"Calculate robot joint angles from hand pose\"\"\"
-    try:
-        from core.robot_control.kinematics import RobotKinematics
-        
-        # Initialize robot kinematics
-        robot = RobotKinematics(robot_type)
-        
-        # Simple mapping for demonstration
-        # In production, this would use sophisticated inverse kinematics
-        if robot_type == "so101":
-            # 5-DOF humanoid hand
-            return [0.0, 0.2, 0.4, 0.1, 0.3]
-        elif robot_type == "so100":
-            # 2-DOF gripper
-            return [0.1, 0.1]
-        elif robot_type == "koch":
-            # 7-DOF arm
-            return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1, 0.0]
-        else:
-            # Default 6-DOF
-            return [0.0, 0.1, 0.0, 0.2, 0.0, 0.1]
-            
-    except Exception as e:
-        print(f"IK Error: {{e}}")
-        return create_mock_joints(robot_type)
-def calculate_robot_pose(joint_angles, robot_type):
-    \"\"\"Calculate end effector pose from joint angles\"\"\"
+            print(f"ERROR: Inference failed: {e}")
+            return create_mock_hand_pose(), create_mock_joints(robot_type), create_mock_pose()
+        return await asyncio.to_thread(process_prediction, result, robot_type, tracking_mode)
+    
+    # Slow path: isolated subprocess that loads the estimator per request
+    temp_input = f"temp_track_{int(time.time())}_{id(frame)}.jpg"
+    cv2.imwrite(temp_input, frame)
     try:
-        from core.robot_control.kinematics import RobotKinematics
-        
-        robot = RobotKinematics(robot_type)
-        
-        # Forward kinematics to get end effector pose
-        q = np.array(joint_angles)
-        T = robot.fk(q)
-        
-        # Extract position and orientation
-        position = T[:3, 3].tolist()
-        rotation_matrix = T[:3, :3]
-        
-        # Convert rotation matrix to Euler angles (simplified)
-        orientation = [0.0, 0.0, 0.0]  # Placeholder
-        
-        return {{
-            "position": position,
-            "orientation": orientation,
-            "transformation_matrix": T.tolist()
-        }}
-        
-    except Exception as e:
-        print(f"FK Error: {{e}}")
-        return create_mock_pose()
+        return await process_hand_tracking_subprocess(temp_input, robot_type, tracking_mode)
+    finally:
+        if os.path.exists(temp_input):
+            os.remove(temp_input)
 
-if __name__ == "__main__":
-    hand_pose, robot_joints, robot_pose = process_frame()
-    result = {{
-        "hand_pose": hand_pose,
-        "robot_joints": robot_joints,
-        "robot_pose": robot_pose
-    }}
-    print("RESULT:" + json.dumps(result))
-"""
-        
-        # Write and execute processing script
-        script_path = f"temp_process_{int(time.time())}_{os.getpid()}.py"
-        with open(script_path, "w") as f:
-            f.write(script_content)
+async def process_hand_tracking_subprocess(image_path: str, robot_type: str, tracking_mode: str = "wilor"):
+    """Hand tracking in a separate Python process (used when no warm estimator is loaded)"""
+    try:
+        # Project root goes on sys.path via `-m` with cwd set to it
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        image_path = os.path.abspath(image_path)
         
         # Try different Python executables in order of preference
         python_executables = [
@@ -971,18 +951,17 @@ if __name__ == "__main__":
                 continue
                 
             try:
-                # Run processing script
-                cmd = [python_exec, script_path]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                # Run the worker module (bytecode cached, unlike a per-request temp script)
+                cmd = [
+                    python_exec, "-m", "backend.hand_worker", image_path,
+                    "--robot-type", robot_type, "--tracking-mode", tracking_mode,
+                ]
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, cwd=project_root)
                 break
             except (FileNotFoundError, subprocess.TimeoutExpired) as e:
                 print(f"Failed with {python_exec}: {e}")
                 continue
         
-        # Clean up script
-        if os.path.exists(script_path):
-            os.remove(script_path)
-        
         if result is None:
             print("All Python executables failed")
             return None, None, None
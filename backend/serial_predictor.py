@@ -0,0 +1,24 @@
+"""
+Hand Teleop System - Shared Estimator Access
+Runs predictions on the one warm estimator off the event loop, one frame at a time
+"""
+import asyncio
+
+from backend.hand_worker import predict_hands
+
+
+class SerialPredictor:
+    """Serializes predictions on a shared estimator
+
+    WiLoR-mini predicts one image per call and its YOLO detector is not
+    thread-safe, so concurrent requests take turns instead of batching.
+    """
+
+    def __init__(self, estimator):
+        self.estimator = estimator
+        self._lock = asyncio.Lock()
+
+    async def predict(self, frame):
+        """Raw prediction for one frame, after any predictions already in flight"""
+        async with self._lock:
+            return await asyncio.to_thread(predict_hands, self.estimator, frame)
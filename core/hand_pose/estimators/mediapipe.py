@@ -22,7 +22,12 @@ class MediaPipeEstimator(HandPoseEstimator):
         device: Optional[str] = None,
         model_path: str = os.path.join(os.path.dirname(__file__), "gesture_recognizer.task"),
         num_hands: int = 1,
+        min_hand_detection_confidence: float = 0.1,
+        min_hand_presence_confidence: float = 0.4,
+        min_tracking_confidence: float = 0.4,
     ):
+        # VIDEO mode only re-runs palm detection when tracking is lost, so
+        # build one instance and feed it every frame rather than per call.
         BaseOptions = mp.tasks.BaseOptions
         GestureRecognizerOptions = vision.GestureRecognizerOptions
         VisionRunningMode = vision.RunningMode
@@ -31,9 +36,9 @@ class MediaPipeEstimator(HandPoseEstimator):
             base_options=BaseOptions(model_asset_path=model_path),
             running_mode=VisionRunningMode.VIDEO,
             num_hands=num_hands,
-            min_hand_detection_confidence=0.1,
-            min_hand_presence_confidence=0.4,
-            min_tracking_confidence=0.4
+            min_hand_detection_confidence=min_hand_detection_confidence,
+            min_hand_presence_confidence=min_hand_presence_confidence,
+            min_tracking_confidence=min_tracking_confidence,
         )
         self._rec = vision.GestureRecognizer.create_from_options(options)
         self._ts_ms = 0  # rolling video timestamp
@@ -8,15 +8,87 @@ try:
 except ImportError:
     WiLorHandPose3dEstimationPipeline = None
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from core.hand_pose.estimators.base import HandPoseEstimator
-from core.hand_pose.types import HandKeypointsPred, TrackedHandKeypoints
+from core.hand_pose.types import HandKeypointsPred
 from core.resource_manager import ResourceManager, ProgressTracker, configure_torch_for_safety
 
 
+# Side of the square hand crop WiLoR-mini feeds its ViT (pipe.IMAGE_SIZE when exposed)
+WILOR_CROP_SIZE = 256
+
+# WiLoR metres -> mm with the y axis flipped, applied in one pass
+_TO_MM_FLIP_Y = np.array([1000, -1000, 1000], dtype=np.float32)
+
+
+def _to_mm_numpy(kp, cam_t, out):
+    np.add(kp, cam_t, out=out)
+    out *= _TO_MM_FLIP_Y
+    return out
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _to_mm(kp, cam_t, out):
+        """(kp + cam_t) * (1000, -1000, 1000) in a single pass, written into out"""
+        for i in range(21):
+            out[i, 0] = (kp[i, 0] + cam_t[0]) * 1000.0
+            out[i, 1] = -(kp[i, 1] + cam_t[1]) * 1000.0
+            out[i, 2] = (kp[i, 2] + cam_t[2]) * 1000.0
+        return out
+else:
+    _to_mm = _to_mm_numpy
+
+
+def _select_dtype(device: str):
+    """Pick the cheapest inference dtype the device handles without overflow"""
+    import torch
+
+    if device.startswith("cuda"):
+        # TF32 tensor cores for any matmul that stays in fp32
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        # bf16 keeps fp32's exponent range (no overflow), fp16 is the fallback
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16
+    return torch.float32
+
+
+def _quantize_for_cpu(pipe) -> bool:
+    """Dynamic int8 quantization of the WiLoR transformer's Linear layers"""
+    import torch
+
+    model = getattr(pipe, "wilor_model", None)
+    if model is None:
+        return False
+
+    pipe.wilor_model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    return True
+
+
+def _compile_for_gpu(pipe) -> bool:
+    """torch.compile the WiLoR transformer; CUDA graphs replay the fixed-shape forward"""
+    import torch
+
+    model = getattr(pipe, "wilor_model", None)
+    if model is None or not hasattr(torch, "compile"):
+        return False
+
+    pipe.wilor_model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+    return True
+
+
 class WiLorEstimator(HandPoseEstimator):
     """Resource-controlled WiLoR hand pose estimator"""
     
-    def __init__(self, device: Optional[str] = None):
+    def __init__(self, device: Optional[str] = None, quantize_cpu: bool = False, compile_gpu: bool = False):
         if WiLorHandPose3dEstimationPipeline is None:
             raise ImportError("WiLoR not installed. Run: pip install 'https://github.com/Joeclinton1/WiLoR-mini'")
             
@@ -30,7 +102,8 @@ class WiLorEstimator(HandPoseEstimator):
         
         print("🔧 Initializing WiLoR with resource management...")
         
-        with self.resource_manager.controlled_execution() as rm:
+        # Pressure monitoring only for the (memory-heavy) model load, not per inference
+        with self.resource_manager.controlled_execution(monitor=True) as rm:
             try:
                 import torch
                 
@@ -46,11 +119,30 @@ class WiLorEstimator(HandPoseEstimator):
                     print(f"🎯 Using specified device: {device}")
                 
                 # Create pipeline with resource management
+                dtype = _select_dtype(device)
                 self.pipe = WiLorHandPose3dEstimationPipeline(
                     device=device,
-                    dtype=torch.float16 if device == "cuda" else torch.float32,  # Use half precision on GPU
+                    dtype=dtype,  # Half precision on GPU, fp32 weights on CPU
                     verbose=False,
                 )
+                print(f"🔢 Inference dtype: {str(dtype).replace('torch.', '')}")
+                
+                # Opt-in int8 backbone on CPU: halves weight bandwidth, uses VNNI where
+                # present, but shifts keypoints slightly, so callers must ask for it
+                if device == "cpu" and quantize_cpu:
+                    try:
+                        if _quantize_for_cpu(self.pipe):
+                            print("🔢 WiLoR backbone quantized to int8 (dynamic)")
+                    except Exception as e:
+                        print(f"⚠️  int8 quantization skipped: {e}")
+                
+                # Opt-in: tracing happens on the first predict, so pair it with warm_up()
+                if device.startswith("cuda") and compile_gpu:
+                    try:
+                        if _compile_for_gpu(self.pipe):
+                            print("⚙️  WiLoR backbone compiled (torch.compile, reduce-overhead)")
+                    except Exception as e:
+                        print(f"⚠️  torch.compile skipped: {e}")
                 
                 print("✅ WiLoR initialized safely")
                 
@@ -58,8 +150,32 @@ class WiLorEstimator(HandPoseEstimator):
                 print(f"❌ Failed to initialize WiLoR: {e}")
                 raise
 
+    def warm_up(self, shape: tuple[int, int, int] = (480, 640, 3), max_hands: int = 2) -> None:
+        """Pay CUDA init, allocator growth, kernel selection and compile tracing up front"""
+        import torch
+
+        # A blank frame has no hand, so this only reaches the YOLO detector...
+        self.pipe.predict(np.zeros(shape, np.uint8))
+
+        # ...and the ViT is driven directly with dummy crops, one batch per hand count
+        model = self.pipe.wilor_model
+        param = next(model.parameters())
+        device = getattr(self.pipe, "device", param.device)
+        dtype = getattr(self.pipe, "dtype", param.dtype)
+        size = getattr(self.pipe, "IMAGE_SIZE", WILOR_CROP_SIZE)
+        with torch.inference_mode():
+            for hands in range(1, max_hands + 1):
+                model(torch.zeros((hands, 3, size, size), device=device, dtype=dtype))
+
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+
     def __call__(self, image: np.ndarray, focal_len: float) -> list[HandKeypointsPred]:
-        """Process image with resource management and progress tracking"""
+        """Process image with resource management and progress tracking
+
+        focal_len is accepted for interface compatibility but ignored: WiLoR
+        derives its own focal length from the image size.
+        """
         
         with self.resource_manager.controlled_execution() as rm:
             progress = ProgressTracker(3, "WiLoR Processing")
@@ -70,16 +186,17 @@ class WiLorEstimator(HandPoseEstimator):
                 
                 progress.update(2, "Processing results...")
                 preds = []
-                for p in raw_preds:
-                    kp = p["wilor_preds"]["pred_keypoints_3d"][0] + p["wilor_preds"]["pred_cam_t_full"][0]
-                    kp *= (1, -1, 1)  # Wilor coordinates need to be flipped in the y axis
-                    kp_mm = kp * 1000  # Convert to mm
-                    
-                    keypoints = []
-                    for idx in range(21):
-                        keypoints.append(TrackedHandKeypoints(np.array([kp_mm[idx]])))
-
-                    preds.append(HandKeypointsPred(keypoints, focal_len))
+                # One float32 block for every hand in the frame; keypoint fields are views into it
+                keypoints_mm = np.empty((len(raw_preds), 21, 3), dtype=np.float32)
+                for p, kp_mm in zip(raw_preds, keypoints_mm):
+                    # Flip y and convert to mm straight into the preallocated rows
+                    _to_mm(
+                        p["wilor_preds"]["pred_keypoints_3d"][0],
+                        p["wilor_preds"]["pred_cam_t_full"][0],
+                        kp_mm,
+                    )
+
+                    preds.append(HandKeypointsPred.from_array(kp_mm, bool(p.get("is_right", True))))
                 
                 progress.update(3, "Complete")
                 progress.complete()
@@ -13,8 +13,26 @@ class TrackedHandKeypoints:
     middle_base: np.ndarray
     middle_tip: np.ndarray
 
+    @classmethod
+    def from_array(cls, kp: np.ndarray) -> "TrackedHandKeypoints":
+        """Build from a (21, 3) landmark array; fields are row views, not copies"""
+        return cls(
+            thumb_mcp   = kp[2],
+            thumb_tip   = kp[4],
+            index_base  = kp[5],
+            index_pip   = kp[6],
+            index_tip   = kp[8],
+            middle_base = kp[9],
+            middle_tip  = kp[12],
+        )
+
 
 @dataclass
 class HandKeypointsPred:
     is_right: bool
     keypoints: TrackedHandKeypoints
+
+    @classmethod
+    def from_array(cls, kp: np.ndarray, is_right: bool = True) -> "HandKeypointsPred":
+        """Wrap a (21, 3) landmark array; keypoint fields share its memory"""
+        return cls(is_right=is_right, keypoints=TrackedHandKeypoints.from_array(kp))
@@ -11,6 +11,74 @@ import signal
 from typing import Optional, Callable
 from contextlib import contextmanager
 
+PSI_CPU_PATH = "/proc/pressure/cpu"
+PSI_MEMORY_PATH = "/proc/pressure/memory"
+CGROUP_MEMORY_CURRENT = "/sys/fs/cgroup/memory.current"
+CGROUP_MEMORY_MAX = "/sys/fs/cgroup/memory.max"
+
+def _open_readonly(path: str) -> Optional[int]:
+    """Open a procfs/sysfs file once so each sample is a single pread"""
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+class PressureSampler:
+    """Cheap resource pressure readings from Linux PSI, with a cgroup v2 fallback"""
+    
+    def __init__(self):
+        self._cpu_fd = _open_readonly(PSI_CPU_PATH)
+        self._memory_fd = _open_readonly(PSI_MEMORY_PATH)
+        self._cgroup_current_fd = None
+        self._cgroup_max = None
+        
+        if self._memory_fd is None:
+            try:
+                with open(CGROUP_MEMORY_MAX) as f:
+                    limit = f.read().strip()
+                if limit != "max":
+                    self._cgroup_max = int(limit)
+                    self._cgroup_current_fd = _open_readonly(CGROUP_MEMORY_CURRENT)
+            except (OSError, ValueError):
+                pass
+    
+    @property
+    def has_psi(self) -> bool:
+        return self._memory_fd is not None
+    
+    @staticmethod
+    def _read_avg10(fd: Optional[int]) -> Optional[float]:
+        """Parse 'some avg10=' (percent of time stalled over the last 10s)"""
+        if fd is None:
+            return None
+        try:
+            line = os.pread(fd, 128, 0).split(b"\n", 1)[0]
+            return float(line.split(b"avg10=", 1)[1].split(b" ", 1)[0])
+        except (OSError, IndexError, ValueError):
+            return None
+    
+    def cpu_stall(self) -> Optional[float]:
+        return self._read_avg10(self._cpu_fd)
+    
+    def memory_stall(self) -> Optional[float]:
+        return self._read_avg10(self._memory_fd)
+    
+    def memory_percent(self) -> float:
+        """Memory usage of the container if limited, else of the host"""
+        if self._cgroup_current_fd is not None:
+            try:
+                current = int(os.pread(self._cgroup_current_fd, 32, 0))
+                return current / self._cgroup_max * 100
+            except (OSError, ValueError):
+                pass
+        return psutil.virtual_memory().percent
+    
+    def close(self):
+        for fd in (self._cpu_fd, self._memory_fd, self._cgroup_current_fd):
+            if fd is not None:
+                os.close(fd)
+        self._cpu_fd = self._memory_fd = self._cgroup_current_fd = None
+
 class ResourceManager:
     """Professional resource management for GPU-intensive operations"""
     
@@ -18,32 +86,40 @@ class ResourceManager:
                  max_cpu_percent: float = 85.0,     # Increased from 70%
                  max_memory_percent: float = 90.0,   # Increased from 80% 
                  max_gpu_memory_percent: float = 75.0, # Increased from 60%
-                 model_loading_mode: bool = False):  # Special mode for model loading
+                 model_loading_mode: bool = False,   # Special mode for model loading
+                 max_cpu_stall_percent: float = 60.0,     # PSI: time with runnable tasks waiting for CPU
+                 max_memory_stall_percent: float = 10.0): # PSI: time with tasks stalled on reclaim
         self.max_cpu_percent = max_cpu_percent
         self.max_memory_percent = max_memory_percent
         self.max_gpu_memory_percent = max_gpu_memory_percent
         self.model_loading_mode = model_loading_mode
+        self.max_cpu_stall_percent = max_cpu_stall_percent
+        self.max_memory_stall_percent = max_memory_stall_percent
         self._monitoring = False
         self._kill_switch = False
         self._emergency_triggered = False
+        self._stop_event = threading.Event()
+        self._configured = False
         
     @contextmanager
-    def controlled_execution(self, progress_callback: Optional[Callable] = None):
-        """Context manager for safe, monitored execution"""
+    def controlled_execution(self, progress_callback: Optional[Callable] = None, monitor: bool = False):
+        """Context manager for safe execution, optionally with a pressure monitor thread"""
         self._kill_switch = False
         self._emergency_triggered = False
+        self._stop_event.clear()
         monitor_thread = None
         
         try:
-            # Start resource monitoring
-            if progress_callback:
-                progress_callback("Initializing resource monitor...", 0)
-            
-            monitor_thread = threading.Thread(target=self._monitor_resources, daemon=True)
-            monitor_thread.start()
+            # Start resource monitoring (opt-in: inference is GPU-bound, not worth a thread)
+            if monitor:
+                if progress_callback:
+                    progress_callback("Initializing resource monitor...", 0)
+                
+                monitor_thread = threading.Thread(target=self._monitor_resources, daemon=True)
+                monitor_thread.start()
             
-            # Configure system for limited resource usage
-            self._configure_system()
+            # Configure system for limited resource usage (no-op after the first call)
+            self.configure_system()
             
             if progress_callback:
                 progress_callback("Safe execution environment ready", 5)
@@ -56,16 +132,22 @@ class ResourceManager:
             raise e
         finally:
             self._kill_switch = True
+            self._stop_event.set()
             if monitor_thread:
                 monitor_thread.join(timeout=2)
             self._cleanup_resources()
     
-    def _configure_system(self):
-        """Configure system for resource-conscious execution"""
+    def configure_system(self):
+        """Configure system for resource-conscious execution, once per manager.
+        
+        Niceness is left to the launcher (main.py runs the backend under nice);
+        calling os.nice() here would demote the process again on every request.
+        """
+        if self._configured:
+            return
+        self._configured = True
+        
         try:
-            # Set process priority to be nice to the system
-            os.nice(5)  # Lower priority
-            
             # Limit CPU affinity if possible
             try:
                 total_cores = os.cpu_count()
@@ -80,44 +162,58 @@ class ResourceManager:
             print(f"⚠️  Warning: Could not configure system limits: {e}")
     
     def _monitor_resources(self):
-        """Monitor system resources and trigger emergency stop if needed"""
+        """Monitor resource pressure and trigger emergency stop if needed"""
         self._monitoring = True
         consecutive_warnings = 0
+        sampler = PressureSampler()
         
-        while not self._kill_switch and self._monitoring:
-            try:
-                # Check CPU usage
-                cpu_percent = psutil.cpu_percent(interval=0.5)
-                
-                # Check memory usage
-                memory = psutil.virtual_memory()
-                
-                # Warning thresholds - more lenient during model loading
-                if self.model_loading_mode:
-                    cpu_warning = cpu_percent > 95  # Very high threshold during loading
-                    memory_warning = memory.percent > 95  # Very high threshold during loading
-                else:
-                    cpu_warning = cpu_percent > self.max_cpu_percent
-                    memory_warning = memory.percent > self.max_memory_percent
-                
-                if cpu_warning or memory_warning:
-                    consecutive_warnings += 1
-                    if consecutive_warnings == 1:  # First warning
-                        print(f"⚠️  Resource warning - CPU: {cpu_percent:.1f}%, Memory: {memory.percent:.1f}%")
-                else:
-                    consecutive_warnings = 0
+        # Warning thresholds - more lenient during model loading
+        if self.model_loading_mode:
+            cpu_stall_limit, memory_stall_limit, memory_limit = 90.0, 25.0, 95.0
+        else:
+            cpu_stall_limit = self.max_cpu_stall_percent
+            memory_stall_limit = self.max_memory_stall_percent
+            memory_limit = self.max_memory_percent
+        
+        try:
+            while not self._kill_switch and self._monitoring:
+                try:
+                    cpu_stall = sampler.cpu_stall()
+                    memory_stall = sampler.memory_stall()
+                    
+                    if memory_stall is not None:
+                        memory_warning = memory_stall > memory_stall_limit
+                        memory_critical = memory_stall > 40.0
+                        memory_status = f"memory stall {memory_stall:.1f}%"
+                    else:
+                        memory_percent = sampler.memory_percent()
+                        memory_warning = memory_percent > memory_limit
+                        memory_critical = memory_percent > 95
+                        memory_status = f"Memory: {memory_percent:.1f}%"
+                    
+                    cpu_warning = cpu_stall is not None and cpu_stall > cpu_stall_limit
+                    
+                    if cpu_warning or memory_warning:
+                        consecutive_warnings += 1
+                        if consecutive_warnings == 1:  # First warning
+                            cpu_status = f"CPU stall {cpu_stall:.1f}%" if cpu_stall is not None else "CPU: n/a"
+                            print(f"⚠️  Resource warning - {cpu_status}, {memory_status}")
+                    else:
+                        consecutive_warnings = 0
+                    
+                    # Emergency brake if resources are critically high
+                    if memory_critical or consecutive_warnings > 10:
+                        print("🚨 EMERGENCY: Critical resource usage - triggering cleanup")
+                        self._emergency_cleanup()
+                        break
+                        
+                except Exception as e:
+                    print(f"Resource monitoring error: {e}")
                 
-                # Emergency brake if resources are critically high
-                if (cpu_percent > 95 or memory.percent > 95 or consecutive_warnings > 10):
-                    print("🚨 EMERGENCY: Critical resource usage - triggering cleanup")
-                    self._emergency_triggered = True
-                    self._emergency_cleanup()
+                if self._stop_event.wait(1.0):
                     break
-                    
-            except Exception as e:
-                print(f"Resource monitoring error: {e}")
-            
-            time.sleep(1.0)
+        finally:
+            sampler.close()
     
     def _emergency_cleanup(self):
         """Emergency resource cleanup"""
@@ -132,7 +228,6 @@ class ResourceManager:
             import torch
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
-                torch.cuda.synchronize()
                 print("✅ GPU memory cleared")
         except ImportError:
             pass
@@ -207,13 +302,13 @@ def configure_torch_for_safety():
         if torch.cuda.is_available():
             # Limit GPU memory growth
             torch.cuda.empty_cache()
-            torch.cuda.set_per_process_memory_fraction(0.6)  # Use max 60% of GPU memory
+            torch.cuda.set_per_process_memory_fraction(0.85)  # Use max 85% of GPU memory
             
-            # Use memory-efficient settings
+            # Off by default: detector input follows each frame's resolution and the
+            # ViT batch follows the hand count, so autotuning would re-run on new shapes
             torch.backends.cudnn.benchmark = False
-            torch.backends.cudnn.deterministic = True
             
-            print("🔧 PyTorch GPU configured for safe usage (60% memory limit)")
+            print("🔧 PyTorch GPU configured for safe usage (85% memory limit)")
         
         # Limit CPU threads
         max_threads = max(1, int(os.cpu_count() * 0.6))
@@ -3,11 +3,71 @@ Mock Hand Data Generator for SO-101 Testing
 Generates realistic hand pose sequences for testing the robot simulation
 """
 
+import functools
 import numpy as np
 import time
 import json
 import math
-from typing import List, Dict, Tuple
+from typing import Dict, Optional
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# JIT kernels for the per-tick motion math: 21-row arrays are too small for NumPy
+# dispatch to pay off. They write into a preallocated (21, 3) buffer and return it.
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _wave_kernel(t, base, segment, finger_group, segment_mask, out):
+        wrist_x = 0.5 + 0.1 * math.sin(t * 2)
+        wrist_y = 0.5 + 0.05 * math.cos(t * 1.5)
+        for i in range(1, 21):
+            j = i - 1
+            finger_curl = (0.5 + 0.3 * math.sin(t * 2 + finger_group[j] * 0.5)) * segment_mask[j]
+            curl_factor = segment[j] * 0.02 * finger_curl
+            out[i, 0] = base[i, 0] + (wrist_x - 0.5)
+            out[i, 1] = base[i, 1] + (wrist_y - 0.5) + curl_factor
+            out[i, 2] = base[i, 2] + curl_factor * 0.5
+        out[0, 0] = wrist_x
+        out[0, 1] = wrist_y
+        out[0, 2] = 0.02 * math.sin(t * 3)
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _point_kernel(t, base, segment, out):
+        swing = 0.05 * math.sin(math.sin(t) * math.pi / 4)
+        for i in range(21):
+            out[i, 0] = base[i, 0]
+            out[i, 1] = base[i, 1]
+            out[i, 2] = base[i, 2]
+        for i in range(5, 9):
+            out[i, 0] += swing * (1.0 + segment[i - 1] * 0.1)
+            out[i, 1] -= 0.05 * segment[i - 1]
+        for i in range(9, 21):
+            curl_amount = segment[i - 1] * 0.03 * 0.8
+            out[i, 1] += curl_amount
+            out[i, 2] += curl_amount * 0.3
+        out[0, 0] = 0.5 + swing
+        out[0, 1] = 0.5
+        out[0, 2] = 0.0
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _grab_kernel(t, base, segment, out):
+        grab_strength = 0.5 + 0.5 * math.sin(t * 3)
+        for i in range(1, 21):
+            curl_amount = segment[i - 1] * 0.04 * grab_strength
+            out[i, 0] = base[i, 0] - (base[i, 0] - 0.5) * curl_amount
+            out[i, 1] = base[i, 1] - (base[i, 1] - 0.45) * curl_amount * 0.5
+            out[i, 2] = base[i, 2] + curl_amount * 0.2
+        out[0, 0] = base[0, 0]
+        out[0, 1] = 0.5 + 0.02 * grab_strength
+        out[0, 2] = base[0, 2]
+        return out
+else:
+    _wave_kernel = _point_kernel = _grab_kernel = None
 
 
 class MockHandDataGenerator:
@@ -15,6 +75,18 @@ class MockHandDataGenerator:
     Generates mock hand landmark data for testing SO-101 robot simulation.
     """
     
+    # Per-finger-landmark (1-20) lookup tables shared by the motion generators
+    # (float32 so the motion math never promotes the float32 landmarks to float64)
+    _SEGMENT = (np.arange(20) % 4).astype(np.float32)        # 0 = MCP ... 3 = TIP
+    _FINGER_GROUP = (np.arange(20) // 4).astype(np.float32)  # 0 = thumb ... 4 = pinky
+    _SEGMENT_MASK = (_SEGMENT > 0).astype(np.float32)     # MCP joints don't curl
+    
+    # Pointing pose coefficients: index finger (landmarks 5-8) extends,
+    # middle/ring/pinky (landmarks 9-20) curl by a fixed amount
+    _POINT_EXTENSION = 1.0 + _SEGMENT[4:8] * 0.1
+    _POINT_LIFT = 0.05 * _SEGMENT[4:8]
+    _POINT_CURL = _SEGMENT[8:] * 0.03 * 0.8
+    
     def __init__(self):
         # Hand landmark indices (MediaPipe format)
         self.LANDMARK_NAMES = [
@@ -29,188 +101,183 @@ class MockHandDataGenerator:
         # Base hand pose (neutral position)
         self.base_landmarks = self._generate_base_hand()
         
+        # Output buffer reused by the motion generators (overwritten on every call)
+        self._out = np.empty((21, 3), dtype=np.float32)
+        
         # Animation parameters
         self.time_offset = 0
         self.motion_speed = 1.0
         
-    def _generate_base_hand(self) -> List[Dict[str, float]]:
-        """Generate base hand landmarks in neutral position."""
-        landmarks = []
-        
-        # Wrist (center reference point)
-        landmarks.append({"x": 0.5, "y": 0.5, "z": 0.0})
+        # Motion type -> generator, one lookup per frame instead of a string compare chain
+        self._dispatch = {
+            "wave": self.generate_wave_motion,
+            "point": self.generate_pointing_motion,
+            "grab": self.generate_grabbing_motion,
+            "static": lambda t: self.base_landmarks,
+        }
         
-        # Thumb (4 points)
-        landmarks.extend([
-            {"x": 0.45, "y": 0.45, "z": 0.02},  # CMC
-            {"x": 0.42, "y": 0.42, "z": 0.04},  # MCP
-            {"x": 0.40, "y": 0.40, "z": 0.06},  # IP
-            {"x": 0.38, "y": 0.38, "z": 0.08}   # TIP
-        ])
+    def _generate_base_hand(self) -> np.ndarray:
+        """Generate base hand landmarks in neutral position as a (21, 3) array."""
+        return np.array([
+            [0.50, 0.50, 0.00],  # Wrist (center reference point)
+            # Thumb: CMC, MCP, IP, TIP
+            [0.45, 0.45, 0.02], [0.42, 0.42, 0.04], [0.40, 0.40, 0.06], [0.38, 0.38, 0.08],
+            # Index finger: MCP, PIP, DIP, TIP
+            [0.48, 0.35, 0.02], [0.48, 0.30, 0.04], [0.48, 0.25, 0.06], [0.48, 0.20, 0.08],
+            # Middle finger: MCP, PIP, DIP, TIP
+            [0.50, 0.35, 0.02], [0.50, 0.28, 0.04], [0.50, 0.22, 0.06], [0.50, 0.16, 0.08],
+            # Ring finger: MCP, PIP, DIP, TIP
+            [0.52, 0.35, 0.02], [0.52, 0.29, 0.04], [0.52, 0.24, 0.06], [0.52, 0.19, 0.08],
+            # Pinky: MCP, PIP, DIP, TIP
+            [0.54, 0.37, 0.02], [0.54, 0.32, 0.04], [0.54, 0.28, 0.06], [0.54, 0.25, 0.08],
+        ], dtype=np.float32)
+    
+    def generate_wave_motion(self, t: float) -> np.ndarray:
+        """Generate hand landmarks for a waving motion (into the shared output buffer)."""
+        if _wave_kernel is not None:
+            return _wave_kernel(t, self.base_landmarks, self._SEGMENT, self._FINGER_GROUP,
+                                self._SEGMENT_MASK, self._out)
         
-        # Index finger (4 points)
-        landmarks.extend([
-            {"x": 0.48, "y": 0.35, "z": 0.02},  # MCP
-            {"x": 0.48, "y": 0.30, "z": 0.04},  # PIP
-            {"x": 0.48, "y": 0.25, "z": 0.06},  # DIP
-            {"x": 0.48, "y": 0.20, "z": 0.08}   # TIP
-        ])
+        sin, cos = math.sin, math.cos
+        landmarks = self._out
         
-        # Middle finger (4 points)
-        landmarks.extend([
-            {"x": 0.50, "y": 0.35, "z": 0.02},  # MCP
-            {"x": 0.50, "y": 0.28, "z": 0.04},  # PIP
-            {"x": 0.50, "y": 0.22, "z": 0.06},  # DIP
-            {"x": 0.50, "y": 0.16, "z": 0.08}   # TIP
-        ])
+        # Wrist movement (side to side)
+        wrist_x = 0.5 + 0.1 * sin(t * 2)
+        wrist_y = 0.5 + 0.05 * cos(t * 1.5)
         
-        # Ring finger (4 points)
-        landmarks.extend([
-            {"x": 0.52, "y": 0.35, "z": 0.02},  # MCP
-            {"x": 0.52, "y": 0.29, "z": 0.04},  # PIP
-            {"x": 0.52, "y": 0.24, "z": 0.06},  # DIP
-            {"x": 0.52, "y": 0.19, "z": 0.08}   # TIP
-        ])
+        # Apply wrist movement to all points
+        landmarks[:] = self.base_landmarks
+        landmarks[:, 0] += wrist_x - 0.5
+        landmarks[:, 1] += wrist_y - 0.5
         
-        # Pinky (4 points)
-        landmarks.extend([
-            {"x": 0.54, "y": 0.37, "z": 0.02},  # MCP
-            {"x": 0.54, "y": 0.32, "z": 0.04},  # PIP
-            {"x": 0.54, "y": 0.28, "z": 0.06},  # DIP
-            {"x": 0.54, "y": 0.25, "z": 0.08}   # TIP
-        ])
+        # Add finger curl/uncurl motion, growing with the segment (MCP joints stay put)
+        finger_curl = (0.5 + 0.3 * np.sin(t * 2 + self._FINGER_GROUP * 0.5)) * self._SEGMENT_MASK
+        curl_factor = self._SEGMENT * 0.02 * finger_curl
+        landmarks[1:, 1] += curl_factor
+        landmarks[1:, 2] += curl_factor * 0.5
         
+        landmarks[0] = (wrist_x, wrist_y, 0.02 * sin(t * 3))
         return landmarks
     
-    def generate_wave_motion(self, t: float) -> List[Dict[str, float]]:
-        """Generate hand landmarks for a waving motion."""
-        landmarks = []
+    def generate_pointing_motion(self, t: float) -> np.ndarray:
+        """Generate hand landmarks for pointing motion (into the shared output buffer)."""
+        if _point_kernel is not None:
+            return _point_kernel(t, self.base_landmarks, self._SEGMENT, self._out)
         
-        # Wrist movement (side to side)
-        wrist_x = 0.5 + 0.1 * math.sin(t * 2)
-        wrist_y = 0.5 + 0.05 * math.cos(t * 1.5)
+        sin = math.sin
         
-        for i, base_landmark in enumerate(self.base_landmarks):
-            landmark = base_landmark.copy()
-            
-            if i == 0:  # Wrist
-                landmark["x"] = wrist_x
-                landmark["y"] = wrist_y
-                landmark["z"] = 0.02 * math.sin(t * 3)
-            else:
-                # Apply wrist movement to all points
-                landmark["x"] = base_landmark["x"] + (wrist_x - 0.5)
-                landmark["y"] = base_landmark["y"] + (wrist_y - 0.5)
-                
-                # Add finger curl/uncurl motion
-                finger_group = (i - 1) // 4
-                finger_curl = 0.5 + 0.3 * math.sin(t * 2 + finger_group * 0.5)
-                
-                # Apply curl based on finger segment
-                segment = (i - 1) % 4
-                if segment > 0:  # Not MCP joint
-                    curl_factor = segment * 0.02 * finger_curl
-                    landmark["y"] += curl_factor
-                    landmark["z"] += curl_factor * 0.5
-            
-            landmarks.append(landmark)
+        # Pointing direction changes over time
+        point_angle = sin(t) * math.pi / 4  # ±45 degrees
+        swing = 0.05 * sin(point_angle)
         
-        return landmarks
-    
-    def generate_pointing_motion(self, t: float) -> List[Dict[str, float]]:
-        """Generate hand landmarks for pointing motion."""
-        landmarks = []
+        landmarks = self._out
+        landmarks[:] = self.base_landmarks
         
-        # Pointing direction changes over time
-        point_angle = math.sin(t) * math.pi / 4  # ±45 degrees
+        # Extend index finger (landmarks 5-8)
+        landmarks[5:9, 0] += swing * self._POINT_EXTENSION
+        landmarks[5:9, 1] -= self._POINT_LIFT
         
-        for i, base_landmark in enumerate(self.base_landmarks):
-            landmark = base_landmark.copy()
-            
-            if i == 0:  # Wrist
-                landmark["x"] = 0.5 + 0.05 * math.sin(point_angle)
-                landmark["y"] = 0.5
-                landmark["z"] = 0.0
-            elif 5 <= i <= 8:  # Index finger
-                # Extend index finger
-                segment = i - 5
-                extension = 1.0 + segment * 0.1
-                
-                landmark["x"] = base_landmark["x"] + 0.05 * math.sin(point_angle) * extension
-                landmark["y"] = base_landmark["y"] - 0.05 * segment
-                landmark["z"] = base_landmark["z"]
-            else:
-                # Curl other fingers
-                curl_factor = 0.8
-                if i > 8:  # Middle, ring, pinky
-                    finger_group = (i - 9) // 4
-                    segment = (i - 9) % 4
-                    
-                    if segment > 0:
-                        curl_amount = segment * 0.03 * curl_factor
-                        landmark["y"] += curl_amount
-                        landmark["z"] += curl_amount * 0.3
-            
-            landmarks.append(landmark)
+        # Curl middle, ring and pinky (landmarks 9-20); thumb stays at rest
+        landmarks[9:, 1] += self._POINT_CURL
+        landmarks[9:, 2] += self._POINT_CURL * 0.3
         
+        landmarks[0] = (0.5 + swing, 0.5, 0.0)
         return landmarks
     
-    def generate_grabbing_motion(self, t: float) -> List[Dict[str, float]]:
-        """Generate hand landmarks for grabbing/grasping motion."""
-        landmarks = []
+    def generate_grabbing_motion(self, t: float) -> np.ndarray:
+        """Generate hand landmarks for grabbing/grasping motion (into the shared output buffer)."""
+        if _grab_kernel is not None:
+            return _grab_kernel(t, self.base_landmarks, self._SEGMENT, self._out)
         
         # Grab strength oscillates
         grab_strength = 0.5 + 0.5 * math.sin(t * 3)
         
-        for i, base_landmark in enumerate(self.base_landmarks):
-            landmark = base_landmark.copy()
-            
-            if i == 0:  # Wrist
-                landmark["y"] = 0.5 + 0.02 * grab_strength
-            else:
-                # All fingers curl toward palm
-                finger_group = (i - 1) // 4
-                segment = (i - 1) % 4
-                
-                if segment > 0:  # Not MCP
-                    curl_amount = segment * 0.04 * grab_strength
-                    
-                    # Curl fingers toward center
-                    center_x = 0.5
-                    center_y = 0.45
-                    
-                    dx = landmark["x"] - center_x
-                    dy = landmark["y"] - center_y
-                    
-                    landmark["x"] -= dx * curl_amount
-                    landmark["y"] -= dy * curl_amount * 0.5
-                    landmark["z"] += curl_amount * 0.2
-            
-            landmarks.append(landmark)
+        landmarks = self._out
+        landmarks[:] = self.base_landmarks
+        
+        # All fingers curl toward palm center (MCP joints stay put)
+        center_x = 0.5
+        center_y = 0.45
+        curl_amount = self._SEGMENT * 0.04 * grab_strength
+        fingers = landmarks[1:]
+        fingers[:, 0] -= (fingers[:, 0] - center_x) * curl_amount
+        fingers[:, 1] -= (fingers[:, 1] - center_y) * curl_amount * 0.5
+        fingers[:, 2] += curl_amount * 0.2
         
+        # Wrist
+        landmarks[0, 1] = 0.5 + 0.02 * grab_strength
         return landmarks
     
-    def get_current_hand_pose(self, motion_type: str = "wave") -> List[Dict[str, float]]:
+    def generate_batch(self, motion_type: str, t: np.ndarray) -> np.ndarray:
         """
-        Get current hand pose based on motion type.
+        Generate many frames of a motion at once, e.g. for replay-based IK tests.
         
         Args:
             motion_type: Type of motion ("wave", "point", "grab", "static")
+            t: Animation times, shape (N,) (same units as generate_*_motion's t)
             
         Returns:
-            List of hand landmarks with x, y, z coordinates
+            (N, 21, 3) float32 array of hand landmarks, one frame per time
         """
-        current_time = time.time() + self.time_offset
-        t = current_time * self.motion_speed
+        # float64 phase: float32 loses precision on large clock-derived times
+        t = np.asarray(t, dtype=np.float64).ravel()
+        landmarks = np.repeat(self.base_landmarks[None], t.size, axis=0)
         
         if motion_type == "wave":
-            return self.generate_wave_motion(t)
+            wrist_x = 0.5 + 0.1 * np.sin(t * 2)
+            wrist_y = 0.5 + 0.05 * np.cos(t * 1.5)
+            landmarks[:, :, 0] += (wrist_x - 0.5)[:, None]
+            landmarks[:, :, 1] += (wrist_y - 0.5)[:, None]
+            
+            finger_curl = (0.5 + 0.3 * np.sin(t[:, None] * 2 + self._FINGER_GROUP * 0.5)) * self._SEGMENT_MASK
+            curl_factor = self._SEGMENT * 0.02 * finger_curl
+            landmarks[:, 1:, 1] += curl_factor
+            landmarks[:, 1:, 2] += curl_factor * 0.5
+            
+            landmarks[:, 0, 0] = wrist_x
+            landmarks[:, 0, 1] = wrist_y
+            landmarks[:, 0, 2] = 0.02 * np.sin(t * 3)
         elif motion_type == "point":
-            return self.generate_pointing_motion(t)
+            swing = 0.05 * np.sin(np.sin(t) * np.pi / 4)
+            landmarks[:, 5:9, 0] += swing[:, None] * self._POINT_EXTENSION
+            landmarks[:, 5:9, 1] -= self._POINT_LIFT
+            landmarks[:, 9:, 1] += self._POINT_CURL
+            landmarks[:, 9:, 2] += self._POINT_CURL * 0.3
+            
+            landmarks[:, 0, 0] = 0.5 + swing
+            landmarks[:, 0, 1] = 0.5
+            landmarks[:, 0, 2] = 0.0
         elif motion_type == "grab":
-            return self.generate_grabbing_motion(t)
-        else:  # static
-            return self.base_landmarks
+            grab_strength = 0.5 + 0.5 * np.sin(t * 3)
+            curl_amount = self._SEGMENT * 0.04 * grab_strength[:, None]
+            fingers = landmarks[:, 1:]
+            fingers[:, :, 0] -= (fingers[:, :, 0] - 0.5) * curl_amount
+            fingers[:, :, 1] -= (fingers[:, :, 1] - 0.45) * curl_amount * 0.5
+            fingers[:, :, 2] += curl_amount * 0.2
+            
+            landmarks[:, 0, 1] = 0.5 + 0.02 * grab_strength
+        
+        return landmarks
+    
+    def get_current_hand_pose(self, motion_type: str = "wave", now: Optional[float] = None) -> np.ndarray:
+        """
+        Get current hand pose based on motion type.
+        
+        Args:
+            motion_type: Type of motion ("wave", "point", "grab", "static")
+            now: time.perf_counter() reading for this frame (read here if omitted)
+            
+        Returns:
+            (21, 3) array of hand landmark x, y, z coordinates. Animated poses
+            share one buffer that the next call overwrites; copy to keep it.
+        """
+        if now is None:
+            now = time.perf_counter()
+        t = (now + self.time_offset) * self.motion_speed
+        
+        # Unknown motion types fall back to the static pose
+        generate = self._dispatch.get(motion_type, self._dispatch["static"])
+        return generate(t)
     
     def set_motion_speed(self, speed: float):
         """Set the speed of motion animations."""
@@ -218,11 +285,13 @@ class MockHandDataGenerator:
     
     def reset_time(self):
         """Reset the animation time."""
-        self.time_offset = -time.time()
+        self.time_offset = -time.perf_counter()
 
 
-# Global instance for easy access
-mock_hand_generator = MockHandDataGenerator()
+@functools.cache
+def get_mock_hand_generator() -> MockHandDataGenerator:
+    """Get the shared mock hand generator (created on first call)."""
+    return MockHandDataGenerator()
 
 
 def get_mock_hand_data(motion_type: str = "wave") -> Dict:
@@ -233,12 +302,14 @@ def get_mock_hand_data(motion_type: str = "wave") -> Dict:
         motion_type: Type of hand motion to generate
         
     Returns:
-        Dictionary with hand landmarks and metadata
+        Dictionary with hand landmarks ([{"x", "y", "z"}, ...]) and metadata
     """
-    landmarks = mock_hand_generator.get_current_hand_pose(motion_type)
+    # perf_counter only drives the motion phase; consumers get wall-clock time
+    landmarks = get_mock_hand_generator().get_current_hand_pose(motion_type, time.perf_counter())
     
     return {
-        "hand_landmarks": landmarks,
+        # Wire format stays {x, y, z} dicts; the ndarray is only used internally
+        "hand_landmarks": [{"x": x, "y": y, "z": z} for x, y, z in landmarks.tolist()],
         "hand_detected": True,
         "confidence": 0.95,
         "motion_type": motion_type,
@@ -263,9 +334,8 @@ if __name__ == "__main__":
         
         print(f"  Landmarks: {len(hand_data['hand_landmarks'])}")
         print(f"  Confidence: {hand_data['confidence']}")
-        print(f"  Wrist position: ({hand_data['hand_landmarks'][0]['x']:.3f}, "
-              f"{hand_data['hand_landmarks'][0]['y']:.3f}, "
-              f"{hand_data['hand_landmarks'][0]['z']:.3f})")
+        wrist = hand_data['hand_landmarks'][0]
+        print(f"  Wrist position: ({wrist['x']:.3f}, {wrist['y']:.3f}, {wrist['z']:.3f})")
         
         # Show first few landmarks
         for i in range(min(3, len(hand_data['hand_landmarks']))):
@@ -4,12 +4,35 @@ Provides real-time joint state management and kinematics for the SO-101 robot ar
 """
 
 import numpy as np
-import asyncio
+import functools
+import importlib.util
 import json
+import math
+import time
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-from .kinematics import RobotKinematics
+URDF_PATH = Path(__file__).parent.parent.parent / "assets" / "meshes" / "so101" / "so101_complete.urdf"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_kinematics(urdf_path: str):
+    """Parse the URDF once per path; shared by every simulation instance."""
+    # Imported here: kinematics pulls in pinocchio at import time
+    from .kinematics import RobotKinematics
+    return RobotKinematics(urdf_path, frame_name="gripper_frame_link")
+
+
+def landmarks_to_array(hand_landmarks) -> np.ndarray:
+    """
+    Normalize hand landmarks to an (N, 3) array.
+    
+    Accepts the wire format's [{"x", "y", "z"}, ...] dicts (a missing z
+    defaults to 0.5) or [[x, y, z], ...] rows / arrays from internal callers.
+    """
+    if len(hand_landmarks) and isinstance(hand_landmarks[0], dict):
+        return np.array([[lm['x'], lm['y'], lm.get('z', 0.5)] for lm in hand_landmarks], dtype=np.float32)
+    return np.asarray(hand_landmarks, dtype=np.float32)
 
 
 class SO101Simulation:
@@ -29,34 +52,58 @@ class SO101Simulation:
             "gripper"
         ]
         
-        # Joint limits (from URDF)
-        self.joint_limits = {
-            "shoulder_pan": (-1.91986, 1.91986),
-            "shoulder_lift": (-1.74533, 1.74533),
-            "elbow_flex": (-1.69, 1.69),
-            "wrist_flex": (-1.65806, 1.65806),
-            "wrist_roll": (-2.74385, 2.84121),
-            "gripper": (-0.174533, 1.74533)
-        }
+        # Joint limits (from URDF), one [lower, upper] row per joint in joint order
+        self._limits = np.array([
+            [-1.91986, 1.91986],    # shoulder_pan
+            [-1.74533, 1.74533],    # shoulder_lift
+            [-1.69, 1.69],          # elbow_flex
+            [-1.65806, 1.65806],    # wrist_flex
+            [-2.74385, 2.84121],    # wrist_roll
+            [-0.174533, 1.74533]    # gripper
+        ], dtype=np.float32)
+        self._lower = self._limits[:, 0]
+        self._upper = self._limits[:, 1]
         
         # Current joint positions (radians)
-        self.joint_positions = np.zeros(6)
+        self.joint_positions = np.zeros(6, dtype=np.float32)
         
         # Target joint positions for smooth interpolation
-        self.target_positions = np.zeros(6)
+        self.target_positions = np.zeros(6, dtype=np.float32)
         
         # Joint velocities for smooth motion
-        self.joint_velocities = np.zeros(6)
+        self.joint_velocities = np.zeros(6, dtype=np.float32)
         
-        # Initialize kinematics
-        urdf_path = Path(__file__).parent.parent.parent / "assets" / "meshes" / "so101" / "so101_complete.urdf"
-        try:
-            self.kinematics = RobotKinematics(str(urdf_path), frame_name="gripper_frame_link")
-            self.kinematics_available = True
-            print(f"✅ SO-101 kinematics initialized with URDF: {urdf_path}")
-        except Exception as e:
-            print(f"⚠️  Kinematics not available: {e}")
-            self.kinematics_available = False
+        # Scratch buffers for update_motion / set_joint_positions (avoid per-call allocations)
+        self._diff = np.zeros(6, dtype=np.float32)
+        self._tmp6 = np.empty(6, dtype=np.float32)
+        
+        # Kinematics load lazily on first FK/IK use (None = not attempted yet)
+        self._urdf_path = URDF_PATH
+        self._kinematics = None
+        self._kinematics_available = None
+    
+    @property
+    def kinematics(self):
+        """RobotKinematics for the SO-101 URDF, loaded on first access (None if unavailable)."""
+        if self._kinematics_available is None:
+            try:
+                self._kinematics = _load_kinematics(str(self._urdf_path))
+                self._kinematics_available = True
+                print(f"✅ SO-101 kinematics initialized with URDF: {self._urdf_path}")
+            except Exception as e:
+                print(f"⚠️  Kinematics not available: {e}")
+                self._kinematics_available = False
+        return self._kinematics
+    
+    @property
+    def kinematics_available(self) -> bool:
+        """Whether FK/IK can be used (loads kinematics if not attempted yet)."""
+        return self.kinematics is not None
+    
+    @property
+    def joint_limits(self) -> Dict[str, Tuple[float, float]]:
+        """Joint limits by name, built on demand for external consumers."""
+        return {name: (lower, upper) for name, (lower, upper) in zip(self.joint_names, self._limits.tolist())}
     
     def get_joint_state(self) -> Dict:
         """Get current joint state as dictionary."""
@@ -65,7 +112,8 @@ class SO101Simulation:
             "positions": self.joint_positions.tolist(),
             "targets": self.target_positions.tolist(),
             "velocities": self.joint_velocities.tolist(),
-            "timestamp": asyncio.get_event_loop().time()
+            # Same monotonic clock the event loop uses, without needing a loop
+            "timestamp": time.monotonic()
         }
     
     def set_joint_positions(self, positions: List[float], smooth: bool = True) -> bool:
@@ -79,22 +127,19 @@ class SO101Simulation:
         Returns:
             True if positions are valid, False otherwise
         """
-        if len(positions) != 6:
+        # No copy when the caller already passes a float32 array
+        positions = np.asarray(positions, dtype=np.float32)
+        if positions.shape != (6,):
             return False
             
         # Clamp to joint limits
-        clamped_positions = []
-        for i, pos in enumerate(positions):
-            joint_name = self.joint_names[i]
-            lower, upper = self.joint_limits[joint_name]
-            clamped_pos = max(lower, min(upper, pos))
-            clamped_positions.append(clamped_pos)
+        clamped_positions = np.clip(positions, self._lower, self._upper, out=self._tmp6)
         
         if smooth:
-            self.target_positions = np.array(clamped_positions)
+            self.target_positions[:] = clamped_positions
         else:
-            self.joint_positions = np.array(clamped_positions)
-            self.target_positions = np.array(clamped_positions)
+            self.joint_positions[:] = clamped_positions
+            self.target_positions[:] = clamped_positions
             
         return True
     
@@ -110,11 +155,15 @@ class SO101Simulation:
         alpha = min(1.0, dt * 10.0)  # Adjust speed as needed
         
         # Calculate velocity
-        position_diff = self.target_positions - self.joint_positions
-        self.joint_velocities = position_diff / dt if dt > 0 else np.zeros(6)
+        position_diff = np.subtract(self.target_positions, self.joint_positions, out=self._diff)
+        if dt > 0:
+            np.divide(position_diff, dt, out=self.joint_velocities)
+        else:
+            self.joint_velocities.fill(0.0)
         
         # Update positions
-        self.joint_positions += position_diff * alpha
+        position_diff *= alpha
+        self.joint_positions += position_diff
     
     def compute_forward_kinematics(self) -> Optional[np.ndarray]:
         """
@@ -127,7 +176,8 @@ class SO101Simulation:
             return None
             
         try:
-            return self.kinematics.fk(self.joint_positions)
+            # Pinocchio needs float64 joint vectors
+            return self.kinematics.fk(self.joint_positions.astype(np.float64))
         except Exception as e:
             print(f"FK computation failed: {e}")
             return None
@@ -159,55 +209,36 @@ class SO101Simulation:
         This is a simplified mapping - can be enhanced with more sophisticated algorithms.
         
         Args:
-            hand_landmarks: List of hand landmark dictionaries with x, y, z coordinates
+            hand_landmarks: [[x, y, z], ...] rows or a list of landmark dicts with x, y, z
             
         Returns:
             List of 6 joint angles, or None if conversion failed
         """
-        if not hand_landmarks or len(hand_landmarks) < 21:
+        if hand_landmarks is None or len(hand_landmarks) < 21:
             return None
             
         try:
-            # Extract key landmarks
-            wrist = hand_landmarks[0]
-            thumb_tip = hand_landmarks[4]
-            index_tip = hand_landmarks[8]
-            middle_tip = hand_landmarks[12]
+            # Extract key landmarks (x, y, z rows)
+            lm = landmarks_to_array(hand_landmarks)
+            wrist, thumb_tip, index_tip, middle_tip = lm[0], lm[4], lm[8], lm[12]
+            
+            # Hand "openness": thumb-index distance drives both elbow and gripper
+            # math.hypot on Python floats: one libm call, no NumPy scalar dispatch
+            hand_span = math.hypot(float(thumb_tip[0] - index_tip[0]), float(thumb_tip[1] - index_tip[1]))
             
             # Simple mapping based on hand orientation and finger positions
             # This is a placeholder - replace with your actual hand-to-robot mapping
-            
-            # Shoulder pan: based on wrist x position
-            shoulder_pan = (wrist['x'] - 0.5) * 2.0  # Scale to joint range
-            
-            # Shoulder lift: based on wrist y position
-            shoulder_lift = (0.5 - wrist['y']) * 1.5
-            
-            # Elbow flex: based on hand "openness"
-            hand_span = np.sqrt((thumb_tip['x'] - index_tip['x'])**2 + 
-                               (thumb_tip['y'] - index_tip['y'])**2)
-            elbow_flex = (hand_span - 0.1) * 3.0
-            
-            # Wrist flex: based on middle finger position
-            wrist_flex = (middle_tip['y'] - wrist['y']) * 2.0
-            
-            # Wrist roll: based on wrist z rotation (if available)
-            wrist_roll = wrist.get('z', 0.5) * 1.0
-            
-            # Gripper: based on thumb-index distance
-            gripper_dist = np.sqrt((thumb_tip['x'] - index_tip['x'])**2 + 
-                                  (thumb_tip['y'] - index_tip['y'])**2)
-            gripper = max(0, min(1.5, gripper_dist * 5.0))
-            
-            joint_angles = [shoulder_pan, shoulder_lift, elbow_flex, wrist_flex, wrist_roll, gripper]
+            joint_angles = np.array([
+                (wrist[0] - 0.5) * 2.0,            # Shoulder pan: wrist x position
+                (0.5 - wrist[1]) * 1.5,            # Shoulder lift: wrist y position
+                (hand_span - 0.1) * 3.0,           # Elbow flex: hand openness
+                (middle_tip[1] - wrist[1]) * 2.0,  # Wrist flex: middle finger position
+                wrist[2] * 1.0,                    # Wrist roll: wrist z
+                min(1.5, hand_span * 5.0),         # Gripper: thumb-index distance
+            ])
             
             # Clamp to limits
-            for i, angle in enumerate(joint_angles):
-                joint_name = self.joint_names[i]
-                lower, upper = self.joint_limits[joint_name]
-                joint_angles[i] = max(lower, min(upper, angle))
-            
-            return joint_angles
+            return np.clip(joint_angles, self._lower, self._upper).tolist()
             
         except Exception as e:
             print(f"Hand pose conversion failed: {e}")
@@ -220,15 +251,16 @@ class SO101Simulation:
             "dof": 6,
             "joint_names": self.joint_names,
             "joint_limits": self.joint_limits,
-            "kinematics_available": self.kinematics_available,
+            # Reported without forcing the URDF parse: before first use, check prerequisites only
+            "kinematics_available": (
+                self._kinematics_available if self._kinematics_available is not None
+                else self._urdf_path.exists() and importlib.util.find_spec("pinocchio") is not None
+            ),
             "urdf_path": "assets/meshes/so101/so101_complete.urdf"
         }
 
 
-# Global simulation instance
-so101_sim = SO101Simulation()
-
-
+@functools.cache
 def get_simulation() -> SO101Simulation:
-    """Get the global SO-101 simulation instance."""
-    return so101_sim
+    """Get the shared SO-101 simulation instance (created on first call)."""
+    return SO101Simulation()
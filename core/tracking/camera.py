@@ -0,0 +1,140 @@
+"""
+Webcam capture helpers shared by the live demos and debug scripts.
+"""
+
+import sys
+import threading
+from typing import Optional
+
+import cv2
+
+DEFAULT_WIDTH = 640
+DEFAULT_HEIGHT = 480
+DEFAULT_FPS = 30
+
+# appsink drop=1 max-buffers=1 keeps only the newest frame in the pipeline
+_GST_PIPELINE = (
+    "v4l2src device=/dev/video{index} ! "
+    "image/jpeg,width={width},height={height},framerate={fps}/1 ! "
+    "jpegdec ! videoconvert ! appsink drop=1 max-buffers=1"
+)
+
+
+def configure_capture(
+    cap: cv2.VideoCapture,
+    width: int = DEFAULT_WIDTH,
+    height: int = DEFAULT_HEIGHT,
+    fps: int = DEFAULT_FPS,
+) -> None:
+    """
+    Ask the driver for a one-frame buffer, MJPG and a fixed mode so read()
+    returns the newest frame instead of one queued several frames ago.
+    """
+    # FOURCC first: some V4L2 drivers only accept the mode once MJPG is set
+    props = (
+        ("FOURCC", cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG")),
+        ("FRAME_WIDTH", cv2.CAP_PROP_FRAME_WIDTH, width),
+        ("FRAME_HEIGHT", cv2.CAP_PROP_FRAME_HEIGHT, height),
+        ("FPS", cv2.CAP_PROP_FPS, fps),
+        ("BUFFERSIZE", cv2.CAP_PROP_BUFFERSIZE, 1),
+    )
+    for name, prop, value in props:
+        if not cap.set(prop, value):
+            print(f"⚠️ Camera backend ignored CAP_PROP_{name}={value}")
+
+
+def open_camera(
+    index: int = 0,
+    width: int = DEFAULT_WIDTH,
+    height: int = DEFAULT_HEIGHT,
+    fps: int = DEFAULT_FPS,
+) -> cv2.VideoCapture:
+    """
+    Open a webcam through GStreamer when OpenCV was built with it (one-frame
+    latency), otherwise through the default backend with configure_capture().
+    """
+    backend = cv2.CAP_ANY
+    if sys.platform.startswith("linux"):
+        pipeline = _GST_PIPELINE.format(index=index, width=width, height=height, fps=fps)
+        cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+        if cap.isOpened():
+            return cap
+        cap.release()
+        # Name V4L2 explicitly so OpenCV doesn't probe other backends first
+        backend = cv2.CAP_V4L2
+
+    cap = cv2.VideoCapture(index, backend)
+    if cap.isOpened():
+        configure_capture(cap, width, height, fps)
+    return cap
+
+
+class FreshestFrame:
+    """
+    Grabs frames on a background thread and keeps only the newest one, so a
+    slow consumer never reads frames that queued up while it was busy.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture):
+        self.cap = cap
+        self._cond = threading.Condition(threading.Lock())
+        self._frame = None
+        self._seq = 0
+        self._last_read = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._thread.start()
+
+    def _grab_loop(self) -> None:
+        while self._running:
+            if not self.cap.grab():
+                break
+            ok, frame = self.cap.retrieve()
+            if not ok:
+                break
+            with self._cond:
+                self._frame = frame
+                self._seq += 1
+                self._cond.notify_all()
+
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def read(self, timeout: Optional[float] = 1.0):
+        """Block until a frame newer than the last one returned is available."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._seq > self._last_read or not self._running, timeout
+            )
+            if self._seq == self._last_read:
+                return False, None
+            self._last_read = self._seq
+            return True, self._frame
+
+    def release(self) -> None:
+        self._running = False
+        self._thread.join(timeout=1.0)
+        self.cap.release()
+
+
+class FrameChangeGate:
+    """
+    Cheap motion check on a 64x48 grayscale thumbnail; lets a loop skip
+    inference while the scene is static.
+    """
+
+    def __init__(self, threshold: float = 2.0, size: tuple[int, int] = (64, 48)):
+        self.threshold = threshold  # mean absolute grey-level change per pixel
+        self.size = size
+        self._prev = None
+
+    def changed(self, frame) -> bool:
+        small = cv2.cvtColor(
+            cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY,
+        )
+        prev, self._prev = self._prev, small
+        if prev is None:
+            return True
+        return cv2.norm(prev, small, cv2.NORM_L1) / small.size >= self.threshold
@@ -5,6 +5,7 @@ Test thumb tip, index PIP, and index tip extraction from MediaPipe
 """
 
 import cv2
+import logging
 import numpy as np
 import sys
 import os
@@ -13,6 +14,9 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.hand_pose.estimators.mediapipe import MediaPipeEstimator
+from core.tracking.camera import FrameChangeGate, FreshestFrame, open_camera
+
+log = logging.getLogger(__name__)
 
 def main():
     print("🚀 MVP Task 1: Testing Minimal Fingertip Detection")
@@ -20,14 +24,19 @@ def main():
     print("Press 'q' to quit\n")
     
     # Initialize webcam
-    cap = cv2.VideoCapture(0)
+    cap = open_camera(0)
     if not cap.isOpened():
         print("❌ Error: Could not open webcam")
         return
     
-    # Initialize MediaPipe estimator
+    # Initialize MediaPipe estimator once: graph setup is expensive, and in
+    # VIDEO mode later frames are tracked instead of re-detected
     try:
-        estimator = MediaPipeEstimator(num_hands=1)
+        estimator = MediaPipeEstimator(
+            num_hands=1,
+            min_hand_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
         print("✅ MediaPipe estimator initialized")
     except Exception as e:
         print(f"❌ Error initializing MediaPipe: {e}")
@@ -38,18 +47,37 @@ def main():
     
     frame_count = 0
     
+    # Capture runs on its own thread so inference always sees the newest frame
+    stream = FreshestFrame(cap)
+    frame_rgb = None
+    
+    # Colour conversion goes through OpenCV's T-API when an OpenCL device exists
+    use_opencl = cv2.ocl.haveOpenCL()
+    cv2.ocl.setUseOpenCL(use_opencl)
+    print(f"🖥️  OpenCL colour conversion: {'on' if use_opencl else 'off'}")
+    
+    # Reuse the last predictions while the scene is static
+    gate = FrameChangeGate()
+    hand_predictions = []
+    
     while True:
-        ret, frame = cap.read()
+        ret, frame = stream.read()
         if not ret:
             print("❌ Failed to read frame")
             break
             
-        # Convert BGR to RGB for MediaPipe
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
         # Process frame
         try:
-            hand_predictions = estimator(frame_rgb, f_px)
+            if gate.changed(frame):
+                # Convert BGR to RGB for MediaPipe (numpy input only)
+                if use_opencl:
+                    frame_rgb = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2RGB).get()
+                else:
+                    # CPU path reuses one buffer across frames
+                    if frame_rgb is None or frame_rgb.shape != frame.shape:
+                        frame_rgb = np.empty_like(frame)
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame_rgb)
+                hand_predictions = estimator(frame_rgb, f_px)
             
             # Display frame info every 30 frames
             if frame_count % 30 == 0:
@@ -59,7 +87,9 @@ def main():
                     print(f"\n📱 Frame {frame_count}: No hands detected")
                     
         except Exception as e:
-            print(f"❌ Error processing frame: {e}")
+            # Lazy %-formatting; the traceback is only rendered at DEBUG level
+            log.warning("❌ Error processing frame: %s", e)
+            log.debug("Frame %d traceback", frame_count, exc_info=True)
             
         # Display frame
         cv2.imshow('MVP Fingertip Detection', frame)
@@ -71,9 +101,10 @@ def main():
         frame_count += 1
     
     # Cleanup
-    cap.release()
     cv2.destroyAllWindows()
+    stream.release()
     print("\n✅ MVP Test completed!")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     main()
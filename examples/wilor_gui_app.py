@@ -130,6 +130,8 @@ import cv2
 import sys
 import os
 
+from backend.hand_worker import draw_keypoints
+
 def process_frame():
     try:
         # Load image
@@ -161,15 +163,7 @@ def process_frame():
         
         # Draw keypoints
         if 'wilor_preds' in hand and 'pred_keypoints_2d' in hand['wilor_preds']:
-            points = hand['wilor_preds']['pred_keypoints_2d'][0]
-            for i, (x, y) in enumerate(points):
-                if i in [4, 8, 12, 16, 20]:  # Fingertips
-                    color = (0, 255, 255)
-                    radius = 8
-                else:  # Other joints
-                    color = (255, 255, 0)
-                    radius = 5
-                cv2.circle(overlay, (int(x), int(y)), radius, color, -1)
+            draw_keypoints(overlay, hand['wilor_preds']['pred_keypoints_2d'][0])
         
         # Save result
         cv2.imwrite("gui_overlay.jpg", overlay)
@@ -0,0 +1,48 @@
+"""
+Blender batch conversion: OBJ assembly -> one GLB per mesh object
+Run with: blender --background --python scripts/assets/blender_convert.py [-- <obj_file> <output_dir>]
+"""
+import bpy
+import os
+import sys
+from pathlib import Path
+
+# Blender keeps its own options before "--"; everything after it belongs to this script
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+obj_file = args[0] if len(args) > 0 else str(PROJECT_ROOT / "core" / "robot_control" / "stp" / "SO101_Assembly.obj")
+output_dir = args[1] if len(args) > 1 else str(PROJECT_ROOT / "frontend" / "assets" / "robot_models" / "so101")
+
+# Clear existing mesh objects
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.object.delete(use_global=False, confirm=False)
+
+# Import OBJ file
+if os.path.exists(obj_file):
+    bpy.ops.import_scene.obj(filepath=obj_file)
+    
+    # Get all mesh objects
+    mesh_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+    
+    # Export each object as GLB
+    os.makedirs(output_dir, exist_ok=True)
+    
+    for i, obj in enumerate(mesh_objects):
+        # Select only this object
+        bpy.ops.object.select_all(action='DESELECT')
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        
+        # Export as GLB
+        output_path = os.path.join(output_dir, f"link_{i:02d}_{obj.name}.glb")
+        bpy.ops.export_scene.gltf(
+            filepath=output_path,
+            use_selection=True,
+            export_format='GLB',
+            export_materials='EXPORT'
+        )
+        print(f"Exported: {output_path}")
+
+else:
+    print(f"OBJ file not found: {obj_file}")
+    print("Please convert STEP to OBJ first")
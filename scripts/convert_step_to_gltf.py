@@ -23,54 +23,9 @@ import json
 from pathlib import Path
 
 def create_blender_script():
-    """Create a Blender Python script for batch conversion"""
-    
-    blender_script = '''
-import bpy
-import os
-import bmesh
-
-# Clear existing mesh objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False, confirm=False)
-
-# Import OBJ file (replace with your actual path)
-obj_file = "/home/jonas-petersen/dev/hand-teleop/core/robot_control/stp/SO101_Assembly.obj"
-if os.path.exists(obj_file):
-    bpy.ops.import_scene.obj(filepath=obj_file)
-    
-    # Get all mesh objects
-    mesh_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
-    
-    # Export each object as GLB
-    output_dir = "/home/jonas-petersen/dev/hand-teleop/frontend/assets/robot_models/so101/"
-    
-    for i, obj in enumerate(mesh_objects):
-        # Select only this object
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        
-        # Export as GLB
-        output_path = os.path.join(output_dir, f"link_{i:02d}_{obj.name}.glb")
-        bpy.ops.export_scene.gltf(
-            filepath=output_path,
-            use_selection=True,
-            export_format='GLB',
-            export_materials='EXPORT'
-        )
-        print(f"Exported: {output_path}")
-
-else:
-    print(f"OBJ file not found: {obj_file}")
-    print("Please convert STEP to OBJ first")
-'''
-    
-    script_path = "/tmp/blender_convert.py"
-    with open(script_path, 'w') as f:
-        f.write(blender_script)
-    
-    return script_path
+    """Return the path of the Blender Python script for batch conversion"""
+    # Shipped as a real file, so nothing is generated or written per run
+    return str(Path(__file__).parent / "assets" / "blender_convert.py")
 
 def main():
     print("🤖 SO-101 STEP to GLTF Conversion Assistant")
@@ -97,8 +52,9 @@ def main():
     
     print("2. 🔧 Run Blender conversion:")
     script_path = create_blender_script()
-    print(f"   - Blender script created: {script_path}")
-    print("   - Run: blender --background --python /tmp/blender_convert.py")
+    print(f"   - Blender script: {script_path}")
+    print(f"   - Run: blender --background --python {script_path} -- <obj_file> <output_dir>")
+    print("     (paths default to core/robot_control/stp/SO101_Assembly.obj and frontend/assets/robot_models/so101)")
     print()
     
     print("3. 📁 Expected output:")
@@ -4,47 +4,81 @@ Professional System Resource Monitor for Hand Teleop
 Monitors CPU, memory, and GPU usage during WiLoR processing
 """
 
-import psutil
+import os
 import time
 import signal
 import sys
 from datetime import datetime
 
+# Disk usage moves on the scale of minutes; re-read it every this many ticks
+DISK_SAMPLE_TICKS = 15
+
+STATUS_LINE = (
+    "[{timestamp}] "
+    "CPU: {cpu_status} {cpu_percent:5.1f}% | "
+    "RAM: {mem_status} {mem_percent:5.1f}% | "
+    "Disk: {disk_status} {disk_percent:4.1f}% | "
+    "GPU: {gpu_info}"
+)
+
 class ResourceMonitor:
     def __init__(self):
         self.monitoring = True
+        self._gpu_mem_info = self._init_gpu()
         
     def monitor(self, interval=2):
         """Monitor system resources with professional output"""
+        import psutil  # only the monitor loop needs it
         print("🔍 Hand Teleop Resource Monitor Started")
         print("Press Ctrl+C to stop monitoring\n")
         
+        # Bound once instead of looked up every tick
+        cpu_percent_now = psutil.cpu_percent
+        virtual_memory = psutil.virtual_memory
+        get_gpu_info = self._get_gpu_info
+        status_icon = self._get_status_icon
+        # On a terminal the line is redrawn in place with one raw write per tick;
+        # redirected output gets one line per tick instead of \r overwrites
+        interactive = os.isatty(1)
+        
+        # Prime the CPU counter; each later call reports usage since the previous one
+        cpu_percent_now(interval=None)
+        disk = None
+        tick = 0
+        
         try:
             while self.monitoring:
+                time.sleep(interval)
+                
                 # Get timestamp
                 timestamp = datetime.now().strftime("%H:%M:%S")
                 
                 # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=interval)
-                cpu_status = self._get_status_icon(cpu_percent, 70, 90)
+                cpu_percent = cpu_percent_now(interval=None)
                 
                 # Memory usage
-                memory = psutil.virtual_memory()
-                mem_status = self._get_status_icon(memory.percent, 70, 85)
+                memory = virtual_memory()
                 
                 # Disk usage
-                disk = psutil.disk_usage('/')
-                disk_status = self._get_status_icon(disk.percent, 80, 90)
-                
-                # GPU info (if available)
-                gpu_info = self._get_gpu_info()
+                if tick % DISK_SAMPLE_TICKS == 0:
+                    disk = psutil.disk_usage('/')
+                tick += 1
                 
                 # Display status
-                print(f"\r[{timestamp}] "
-                      f"CPU: {cpu_status} {cpu_percent:5.1f}% | "
-                      f"RAM: {mem_status} {memory.percent:5.1f}% | "
-                      f"Disk: {disk_status} {disk.percent:4.1f}% | "
-                      f"GPU: {gpu_info}", end="", flush=True)
+                line = STATUS_LINE.format(
+                    timestamp=timestamp,
+                    cpu_status=status_icon(cpu_percent, 70, 90),
+                    cpu_percent=cpu_percent,
+                    mem_status=status_icon(memory.percent, 70, 85),
+                    mem_percent=memory.percent,
+                    disk_status=status_icon(disk.percent, 80, 90),
+                    disk_percent=disk.percent,
+                    gpu_info=get_gpu_info(),
+                )
+                if interactive:
+                    os.write(1, ("\r" + line).encode())
+                else:
+                    print(line, flush=True)
                 
                 # Check for critical usage
                 if cpu_percent > 95 or memory.percent > 95:
@@ -63,19 +97,40 @@ class ResourceMonitor:
         else:
             return "🔴"
     
-    def _get_gpu_info(self):
-        """Get GPU information if available"""
+    def _init_gpu(self):
+        """Pick a (free, total) GPU memory reader once; None when there is no GPU"""
+        # NVML reads driver counters without importing torch just for the monitor
+        if "torch" not in sys.modules:
+            try:
+                import pynvml
+                pynvml.nvmlInit()
+                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                
+                def nvml_mem_info():
+                    info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                    return info.free, info.total
+                return nvml_mem_info
+            except Exception:
+                pass
         try:
             import torch
             if torch.cuda.is_available():
-                gpu_memory = torch.cuda.memory_allocated() / 1024**3  # GB
-                gpu_max = torch.cuda.max_memory_allocated() / 1024**3  # GB
-                gpu_percent = (gpu_memory / gpu_max * 100) if gpu_max > 0 else 0
-                gpu_status = self._get_status_icon(gpu_percent, 60, 80)
-                return f"{gpu_status} {gpu_percent:4.1f}%"
-        except:
+                return lambda: torch.cuda.mem_get_info(0)
+        except Exception:
             pass
-        return "N/A"
+        return None
+    
+    def _get_gpu_info(self):
+        """Get GPU memory usage against device capacity, if a GPU is available"""
+        if self._gpu_mem_info is None:
+            return "N/A"
+        try:
+            free, total = self._gpu_mem_info()
+        except Exception:
+            return "N/A"
+        gpu_percent = (total - free) / total * 100
+        gpu_status = self._get_status_icon(gpu_percent, 60, 80)
+        return f"{gpu_status} {gpu_percent:4.1f}%"
 
 def signal_handler(sig, frame):
     print("\n\n🛑 Monitoring interrupted by user")
@@ -4,30 +4,38 @@ Comprehensive Test Suite for Hand Teleop System
 Tests all core functionality and identifies issues
 """
 
+import atexit
 import sys
 import os
 import time
 import json
 import requests
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent  # Go up to project root
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# One keep-alive connection pool for every request to the local backend
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=16, max_retries=0))
+atexit.register(SESSION.close)
+
 class TestRunner:
     def __init__(self):
         self.base_url = "http://localhost:8000"
         self.results = {}
         self.errors = []
         
-    def log_error(self, test_name, error):
-        """Log an error for later review"""
+    def log_error(self, test_name, error, tb=None):
+        """Log an error for later review; tb defaults to the exception being handled"""
         self.errors.append({
             "test": test_name,
             "error": str(error),
-            "traceback": traceback.format_exc()
+            "traceback": tb if tb is not None else traceback.format_exc()
         })
     
     def test_core_imports(self):
@@ -68,28 +76,35 @@ class TestRunner:
             ("POST", "/api/config/robot", {"robot_type": "so101"}),
         ]
         
+        # Endpoints are independent, so probe them concurrently; map() keeps report order
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            outcomes = list(executor.map(lambda args: self._check_endpoint(*args), endpoints))
+        
         results = {}
-        for method, endpoint, data in endpoints:
-            try:
-                if method == "GET":
-                    response = requests.get(f"{self.base_url}{endpoint}", timeout=10)
-                else:
-                    response = requests.post(f"{self.base_url}{endpoint}", json=data, timeout=10)
-                
-                if response.status_code == 200:
-                    print(f"✅ {method} {endpoint}")
-                    results[endpoint] = True
-                else:
-                    print(f"❌ {method} {endpoint} - Status: {response.status_code}")
-                    results[endpoint] = False
-                    
-            except Exception as e:
-                print(f"❌ {method} {endpoint} - Error: {e}")
-                results[endpoint] = False
-                self.log_error(f"{method} {endpoint}", e)
+        for (method, endpoint, _), (ok, error) in zip(endpoints, outcomes):
+            results[endpoint] = ok
+            if ok:
+                print(f"✅ {method} {endpoint}")
+            elif isinstance(error, Exception):
+                print(f"❌ {method} {endpoint} - Error: {error}")
+                # Raised on a worker thread, so pass its traceback explicitly
+                self.log_error(f"{method} {endpoint}", error, "".join(traceback.format_exception(error)))
+            else:
+                print(f"❌ {method} {endpoint} - Status: {error}")
         
         return all(results.values())
     
+    def _check_endpoint(self, method, endpoint, data):
+        """Returns (ok, status code or exception)"""
+        try:
+            if method == "GET":
+                response = SESSION.get(f"{self.base_url}{endpoint}", timeout=10)
+            else:
+                response = SESSION.post(f"{self.base_url}{endpoint}", json=data, timeout=10)
+        except Exception as e:
+            return False, e
+        return response.status_code == 200, response.status_code
+    
     def test_hand_pose_estimators(self):
         """Test hand pose estimator creation"""
         print("\n🔍 Testing hand pose estimators...")
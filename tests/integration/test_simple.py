@@ -2,14 +2,21 @@
 """
 Simple test for the hand tracking endpoint
 """
+import atexit
+import functools
 import requests
 import json
 import base64
 import cv2
 import numpy as np
+from requests.adapters import HTTPAdapter
 
-def create_test_image():
-    """Create a simple test image"""
+# One keep-alive connection pool for every request to the local backend
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=16, max_retries=0))
+atexit.register(SESSION.close)
+
+def _draw_test_frame():
     img = np.zeros((480, 640, 3), dtype=np.uint8)
     # Draw a simple hand-like shape
     cv2.circle(img, (320, 240), 50, (255, 255, 255), -1)  # Palm
@@ -18,10 +25,17 @@ def create_test_image():
     cv2.circle(img, (320, 170), 15, (255, 255, 255), -1)
     cv2.circle(img, (340, 180), 15, (255, 255, 255), -1)
     cv2.circle(img, (360, 200), 15, (255, 255, 255), -1)
-    
-    # Convert to base64
-    _, buffer = cv2.imencode('.jpg', img)
-    img_base64 = base64.b64encode(buffer).decode('utf-8')
+    return img
+
+# Drawn once; the frame is only ever read, so every call can share it
+_TEST_FRAME = _draw_test_frame()
+
+@functools.cache
+def create_test_image():
+    """Create a simple test image (encoded once; the payload never changes)"""
+    # Convert to base64 (quality 50 is plenty for a synthetic payload and encodes faster)
+    _, buffer = cv2.imencode('.jpg', _TEST_FRAME, [cv2.IMWRITE_JPEG_QUALITY, 50, cv2.IMWRITE_JPEG_OPTIMIZE, 0])
+    img_base64 = base64.b64encode(buffer).decode('ascii')
     return f"data:image/jpeg;base64,{img_base64}"
 
 def test_tracking():
@@ -37,7 +51,7 @@ def test_tracking():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/api/track",
             json=track_data,
             headers={'Content-Type': 'application/json'},
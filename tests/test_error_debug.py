@@ -4,30 +4,74 @@ Minimal test to identify the exact error location
 """
 import cv2
 import json
+import logging
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.estimator_server import connect_or_create_estimator
+from backend.hand_worker import keypoints_to_list, predict_hands
+
+
+log = logging.getLogger(__name__)
+
+
+def _tensor_to_list(t):
+    return t.detach().cpu().numpy().tolist()
+
+# Exact-type dispatch; tensor types are added the first time one is seen
+_JSON_HANDLERS = {
+    np.ndarray: np.ndarray.tolist,
+    np.float32: float,
+    np.float64: float,
+    np.int32: int,
+    np.int64: int,
+    np.bool_: bool,
+}
+
+
+class MLEncoder(json.JSONEncoder):
+    """JSON encoder that accepts torch tensors and numpy arrays/scalars"""
+
+    def default(self, o):
+        handler = _JSON_HANDLERS.get(type(o))
+        if handler is None:
+            # torch stays unimported here; recognise tensors by duck type once per type
+            if not hasattr(o, "detach"):
+                return super().default(o)
+            handler = _JSON_HANDLERS[type(o)] = _tensor_to_list
+        return handler(o)
+
+
+def draw_test_frame():
+    """Draw the synthetic hand-like test frame"""
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    # Add some features that might trigger hand detection
+    cv2.rectangle(frame, (200, 150), (400, 350), (200, 200, 200), -1)  # Hand palm
+    cv2.circle(frame, (220, 120), 20, (180, 180, 180), -1)  # Finger 1
+    cv2.circle(frame, (260, 110), 20, (180, 180, 180), -1)  # Finger 2
+    cv2.circle(frame, (300, 120), 20, (180, 180, 180), -1)  # Finger 3
+    cv2.circle(frame, (340, 130), 20, (180, 180, 180), -1)  # Finger 4
+    cv2.circle(frame, (380, 150), 20, (180, 180, 180), -1)  # Thumb
+    return frame
 
 def test_minimal_error():
+    # Start the (slow) model load now so it overlaps with building/writing the test image
+    executor = ThreadPoolExecutor(max_workers=1)
+    estimator_future = executor.submit(connect_or_create_estimator)
+    executor.shutdown(wait=False)
+    
     try:
-        # Create test image with hand-like shape
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        # Add some features that might trigger hand detection
-        cv2.rectangle(frame, (200, 150), (400, 350), (200, 200, 200), -1)  # Hand palm
-        cv2.circle(frame, (220, 120), 20, (180, 180, 180), -1)  # Finger 1
-        cv2.circle(frame, (260, 110), 20, (180, 180, 180), -1)  # Finger 2
-        cv2.circle(frame, (300, 120), 20, (180, 180, 180), -1)  # Finger 3
-        cv2.circle(frame, (340, 130), 20, (180, 180, 180), -1)  # Finger 4
-        cv2.circle(frame, (380, 150), 20, (180, 180, 180), -1)  # Thumb
+        frame = draw_test_frame()
         
         cv2.imwrite("test_hand_image.jpg", frame)
         print("✅ Test image created")
         
         # Load WiLoR
-        from core.hand_pose.factory import create_estimator
-        estimator = create_estimator("wilor")
+        estimator = estimator_future.result()
         print("✅ WiLoR loaded")
         
         # Process
-        result = estimator.pipe.predict(frame, hand="right")
+        result = predict_hands(estimator, frame)
         print(f"✅ Prediction complete: {len(result) if result else 0} hands detected")
         
         if result and len(result) > 0:
@@ -67,29 +111,24 @@ def test_minimal_error():
                     
                     # Test keypoint access - this might also cause issues
                     try:
-                        if hasattr(keypoints, 'cpu'):
-                            keypoints_numpy = keypoints.cpu().numpy()
-                            print(f"  - keypoints shape: {keypoints_numpy.shape}")
-                            if len(keypoints_numpy) > 0:
-                                points = keypoints_numpy[0]
-                                print(f"  - first hand points shape: {points.shape}")
-                                for i, (x, y) in enumerate(points[:3]):  # Test first 3 points
-                                    print(f"    - point {i}: ({float(x)}, {float(y)})")
-                        else:
-                            points = keypoints[0]
-                            print(f"  - direct points shape: {points.shape if hasattr(points, 'shape') else 'no shape'}")
+                        print(f"  - keypoints shape: {tuple(keypoints.shape)}")
+                        # One C-level conversion instead of float() per coordinate
+                        xy = keypoints_to_list(keypoints, 2)
+                        for i, (x, y) in enumerate(xy[:3]):  # Test first 3 points
+                            print(f"    - point {i}: ({x}, {y})")
+                        
+                        # Arrays go straight to the encoder, no manual list conversion
+                        hand_data = {'hand_bbox': hand.get('hand_bbox'), 'keypoints_2d': keypoints}
+                        print(f"  - JSON serializable: {len(json.dumps(hand_data, cls=MLEncoder))} bytes")
                     except Exception as e:
-                        print(f"  - keypoints access error: {e}")
-                        import traceback
-                        traceback.print_exc()
+                        log.exception("  - keypoints access error: %s", e)
                         
         else:
             print("❌ No hand detected")
             
     except Exception as e:
-        print(f"💥 Main error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("💥 Main error: %s", e)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     test_minimal_error()
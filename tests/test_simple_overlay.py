@@ -3,11 +3,33 @@
 Ultra-simple WiLoR test: Take photo -> Process -> Save overlay
 """
 import cv2
+import gc
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.estimator_server import connect_or_create_estimator
+from backend.hand_worker import predict_hands
+from core.tracking.camera import open_camera
+
+
+def _write_jpeg(path, image, quality=85):
+    """Encode in memory and write the bytes; runs on the writer thread"""
+    ok, buf = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if ok:
+        with open(path, "wb") as f:
+            f.write(buf.tobytes())
+    return ok
 
 def main():
+    # Start the (slow) model load now so it overlaps with camera capture and disk I/O
+    executor = ThreadPoolExecutor(max_workers=1)
+    estimator_future = executor.submit(connect_or_create_estimator)
+    executor.shutdown(wait=False)
+    # Image writes go through their own thread so they never stall capture or inference
+    writer = ThreadPoolExecutor(max_workers=1)
+    
     print("📸 1) Taking photo...")
-    cap = cv2.VideoCapture(0)
+    cap = open_camera(0)
     if not cap.isOpened():
         print("❌ Camera error")
         return
@@ -18,14 +40,13 @@ def main():
         print("❌ Photo capture failed")
         return
     
-    # Save original immediately
-    cv2.imwrite("photo_original.jpg", frame)
-    print("✅ Photo saved: photo_original.jpg")
+    # Save original in the background while the model finishes loading
+    writer.submit(_write_jpeg, "photo_original.jpg", frame)
+    print("✅ Photo queued: photo_original.jpg")
     
     print("🧠 2) Loading WiLoR (this may take 30 seconds)...")
     try:
-        from core.hand_pose.factory import create_estimator
-        estimator = create_estimator("wilor")
+        estimator = estimator_future.result()
         print("✅ WiLoR loaded")
     except Exception as e:
         print(f"❌ WiLoR error: {e}")
@@ -33,7 +54,7 @@ def main():
     
     print("🔄 3) Processing hand pose...")
     try:
-        result = estimator.pipe.predict(frame, hand="right")
+        result = predict_hands(estimator, frame)
         
         if not result or len(result) == 0:
             print("❌ No hand detected")
@@ -58,19 +79,19 @@ def main():
                 color = (0, 255, 255) if i in [4, 8, 12, 16, 20] else (255, 255, 0)  # Yellow for fingertips
                 cv2.circle(overlay, (int(x), int(y)), 5, color, -1)
         
-        # Save overlay immediately
-        cv2.imwrite("photo_overlay.jpg", overlay)
-        print("✅ Overlay saved: photo_overlay.jpg")
+        # Save overlay
+        writer.submit(_write_jpeg, "photo_overlay.jpg", overlay)
+        print("✅ Overlay queued: photo_overlay.jpg")
         
         # Clean up to prevent crashes
         del estimator
-        import gc
         gc.collect()
         
     except Exception as e:
         print(f"❌ Processing error: {e}")
         return
     
+    writer.shutdown(wait=True)
     print("🎉 Complete! Check photo_overlay.jpg")
 
 if __name__ == "__main__":
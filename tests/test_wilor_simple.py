@@ -3,8 +3,26 @@
 Simple WiLoR test - takes one photo and shows hand pose estimation with visualization
 """
 import cv2
+import logging
 import numpy as np
+from backend.hand_worker import predict_hands
 from core.hand_pose.factory import create_estimator
+from core.tracking.camera import open_camera
+
+log = logging.getLogger(__name__)
+
+def _hand_result_arrays(hand_result):
+    """Flatten a raw WiLoR hand result into numeric arrays for np.savez"""
+    arrays = {}
+    for key, value in hand_result.items():
+        items = value.items() if isinstance(value, dict) else [(None, value)]
+        for sub_key, item in items:
+            if hasattr(item, "detach"):
+                item = item.detach().cpu().numpy()
+            item = np.ascontiguousarray(item)
+            if item.dtype != object:
+                arrays[key if sub_key is None else f"{key}__{sub_key}"] = item
+    return arrays
 
 def main():
     print("🤖 Simple WiLoR Hand Pose Test with Visualization")
@@ -12,7 +30,7 @@ def main():
     
     # Initialize camera
     print("📷 Opening camera...")
-    cap = cv2.VideoCapture(0)
+    cap = open_camera(0)
     if not cap.isOpened():
         print("❌ Error: Could not open camera")
         return
@@ -24,11 +42,11 @@ def main():
     try:
         estimator = create_estimator("wilor")
         print("✅ WiLoR loaded successfully!")
+        # Pay CUDA init and kernel selection now, not on the captured frames
+        print("🔥 Warming up WiLoR...")
+        estimator.warm_up()
     except Exception as e:
-        print(f"❌ Error loading WiLoR: {e}")
-        print(f"🔍 Full error details:")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Error loading WiLoR: %s", e)
         cap.release()
         return
     
@@ -40,7 +58,8 @@ def main():
         print(f"   {i}...")
         cv2.waitKey(1000)
     
-    # Capture frame
+    # Capture frame (a single frame on purpose: WiLoR-mini predicts one image
+    # per call, so a burst would only multiply the inference work)
     ret, frame = cap.read()
     if not ret:
         print("❌ Error: Could not capture frame")
@@ -52,7 +71,7 @@ def main():
     # Process with WiLoR
     print("🔄 Processing with WiLoR...")
     try:
-        result = estimator.pipe.predict(frame, hand="right")
+        result = predict_hands(estimator, frame)
         
         if result is None or len(result) == 0:
             print("❌ No hand detected in the image")
@@ -71,6 +90,11 @@ def main():
                 for key, value in hand_result.items():
                     print(f"   {key}: {type(value)} - {getattr(value, 'shape', 'no shape') if hasattr(value, 'shape') else value}")
                     
+                # Dump the raw prediction as binary arrays for offline inspection
+                arrays = _hand_result_arrays(hand_result)
+                np.savez_compressed("debug_hand_data.npz", **arrays)
+                print(f"💾 Saved {len(arrays)} raw arrays to 'debug_hand_data.npz'")
+                
                 # If there are keypoints, show some details
                 if 'wilor_preds' in hand_result and 'pred_keypoints_3d' in hand_result['wilor_preds']:
                     keypoints = hand_result['wilor_preds']['pred_keypoints_3d'][0]
@@ -148,9 +172,7 @@ def main():
                 print(f"   Hand result: {hand_result}")
                 
     except Exception as e:
-        print(f"❌ Error during processing: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Error during processing: %s", e)
     
     # Save the captured image
     cv2.imwrite("captured_hand.jpg", frame)
@@ -161,4 +183,5 @@ def main():
     print("\n✅ Test completed!")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     main()
\ No newline at end of file
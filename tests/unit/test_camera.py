@@ -0,0 +1,113 @@
+"""
+Unit tests for the capture helpers, using synthetic frames and a fake capture
+"""
+
+import queue
+import threading
+import unittest
+
+import numpy as np
+
+from core.tracking.camera import FrameChangeGate, FreshestFrame
+
+
+def solid_frame(value, shape=(48, 64, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+class FakeCapture:
+    """cv2.VideoCapture stand-in fed from a queue; putting None ends the stream"""
+
+    def __init__(self):
+        self.frames = queue.Queue()
+        self.exhausted = threading.Event()
+        self.released = False
+        self._next = None
+
+    def grab(self):
+        self._next = self.frames.get()
+        if self._next is None:
+            self.exhausted.set()
+            return False
+        return True
+
+    def retrieve(self):
+        return True, self._next
+
+    def release(self):
+        self.released = True
+
+
+class TestFreshestFrame(unittest.TestCase):
+    """Test that readers only ever see the newest, unseen frame"""
+
+    def setUp(self):
+        self.cap = FakeCapture()
+        self.reader = FreshestFrame(self.cap)
+
+    def tearDown(self):
+        self.cap.frames.put(None)
+        self.reader.release()
+
+    def test_stale_frames_are_dropped(self):
+        for value in (1, 2, 3):
+            self.cap.frames.put(solid_frame(value))
+        self.cap.frames.put(None)
+        self.assertTrue(self.cap.exhausted.wait(1.0))
+
+        ok, frame = self.reader.read()
+        self.assertTrue(ok)
+        self.assertEqual(frame[0, 0, 0], 3)
+        # Stream ended and the last frame was already returned
+        self.assertEqual(self.reader.read(timeout=0.05), (False, None))
+
+    def test_frame_is_returned_once(self):
+        self.cap.frames.put(solid_frame(1))
+        ok, frame = self.reader.read()
+        self.assertTrue(ok)
+        self.assertEqual(frame[0, 0, 0], 1)
+        self.assertEqual(self.reader.read(timeout=0.05), (False, None))
+
+        self.cap.frames.put(solid_frame(2))
+        ok, frame = self.reader.read()
+        self.assertTrue(ok)
+        self.assertEqual(frame[0, 0, 0], 2)
+
+    def test_read_times_out_without_frames(self):
+        self.assertEqual(self.reader.read(timeout=0.05), (False, None))
+
+    def test_release_stops_thread_and_capture(self):
+        self.cap.frames.put(None)
+        self.reader.release()
+        self.assertTrue(self.cap.released)
+        self.assertFalse(self.reader._thread.is_alive())
+
+
+class TestFrameChangeGate(unittest.TestCase):
+    """Test the thumbnail motion check"""
+
+    def test_first_frame_counts_as_changed(self):
+        self.assertTrue(FrameChangeGate().changed(solid_frame(100)))
+
+    def test_static_and_noisy_frames_are_skipped(self):
+        gate = FrameChangeGate(threshold=2.0)
+        gate.changed(solid_frame(100))
+        self.assertFalse(gate.changed(solid_frame(100)))
+        self.assertFalse(gate.changed(solid_frame(101)))
+
+    def test_large_change_passes(self):
+        gate = FrameChangeGate(threshold=2.0)
+        gate.changed(solid_frame(100))
+        moved = solid_frame(100)
+        moved[:, :32] = 200  # Half the scene changes
+        self.assertTrue(gate.changed(moved))
+
+    def test_input_resolution_does_not_matter(self):
+        gate = FrameChangeGate()
+        self.assertTrue(gate.changed(solid_frame(0, (480, 640, 3))))
+        self.assertFalse(gate.changed(solid_frame(0, (720, 1280, 3))))
+        self.assertTrue(gate.changed(solid_frame(50, (240, 320, 3))))
+
+
+if __name__ == "__main__":
+    unittest.main()
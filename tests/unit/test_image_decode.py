@@ -0,0 +1,99 @@
+"""
+Unit tests for the JPEG header parsing and reduced decode used by the API server
+"""
+
+import unittest
+
+import cv2
+import numpy as np
+
+from backend.hand_worker import decode_image, jpeg_size, scale_keypoints
+
+
+def encode(width, height, ext=".jpg", params=()):
+    """Encode a synthetic gradient frame of the given size"""
+    frame = np.zeros((height, width, 3), np.uint8)
+    frame[:] = np.linspace(0, 255, width, dtype=np.uint8)[None, :, None]
+    ok, buffer = cv2.imencode(ext, frame, list(params))
+    assert ok
+    return buffer.tobytes()
+
+
+class TestJpegSize(unittest.TestCase):
+    """Test SOF header parsing"""
+
+    def test_baseline_jpeg(self):
+        self.assertEqual(jpeg_size(encode(640, 480)), (640, 480))
+
+    def test_progressive_jpeg(self):
+        data = encode(320, 200, params=(cv2.IMWRITE_JPEG_PROGRESSIVE, 1))
+        self.assertEqual(jpeg_size(data), (320, 200))
+
+    def test_non_jpeg_input(self):
+        self.assertIsNone(jpeg_size(encode(64, 48, ext=".png")))
+        self.assertIsNone(jpeg_size(b""))
+        self.assertIsNone(jpeg_size(b"not an image"))
+
+    def test_truncated_jpeg(self):
+        # Header cut before the SOF segment
+        self.assertIsNone(jpeg_size(encode(640, 480)[:20]))
+
+
+class TestDecodeImage(unittest.TestCase):
+    """Test reduced decode factor choice"""
+
+    def test_scale_keeps_long_side_above_minimum(self):
+        for (width, height), factor in [((2048, 1536), 4), ((1280, 960), 2), ((640, 480), 1)]:
+            with self.subTest(size=(width, height)):
+                frame, scale = decode_image(encode(width, height))
+                self.assertEqual(scale, factor)
+                self.assertEqual(frame.shape, (height // factor, width // factor, 3))
+
+    def test_custom_minimum(self):
+        frame, scale = decode_image(encode(1280, 960), min_long_side=160)
+        self.assertEqual(scale, 8)
+        self.assertEqual(frame.shape, (120, 160, 3))
+
+    def test_none_decodes_full_size(self):
+        frame, scale = decode_image(encode(2048, 1536), min_long_side=None)
+        self.assertEqual(scale, 1)
+        self.assertEqual(frame.shape, (1536, 2048, 3))
+
+    def test_non_jpeg_decodes_full_size(self):
+        frame, scale = decode_image(encode(1280, 960, ext=".png"))
+        self.assertEqual(scale, 1)
+        self.assertEqual(frame.shape, (960, 1280, 3))
+
+    def test_invalid_bytes(self):
+        frame, scale = decode_image(b"not an image")
+        self.assertIsNone(frame)
+        self.assertEqual(scale, 1)
+
+
+class TestScaleKeypoints(unittest.TestCase):
+    """Test mapping keypoints back to the original resolution"""
+
+    def test_wilor_pixels_are_scaled(self):
+        pose = {'tracking_method': 'wilor', 'keypoints_2d': [[10.0, 20.0], [1.5, 2.5]]}
+        scale_keypoints(pose, 4)
+        self.assertEqual(pose['keypoints_2d'], [[40.0, 80.0], [6.0, 10.0]])
+
+    def test_scale_one_is_untouched(self):
+        keypoints = [[10.0, 20.0]]
+        pose = {'tracking_method': 'wilor', 'keypoints_2d': keypoints}
+        scale_keypoints(pose, 1)
+        self.assertIs(pose['keypoints_2d'], keypoints)
+
+    def test_normalized_and_mock_poses_are_untouched(self):
+        for method in ('mediapipe', 'mock'):
+            with self.subTest(method=method):
+                pose = {'tracking_method': method, 'keypoints_2d': [[0.5, 0.25]]}
+                scale_keypoints(pose, 2)
+                self.assertEqual(pose['keypoints_2d'], [[0.5, 0.25]])
+
+    def test_missing_pose(self):
+        self.assertIsNone(scale_keypoints(None, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
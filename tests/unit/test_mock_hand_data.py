@@ -0,0 +1,62 @@
+"""
+Unit tests for the mock hand motion generators: numba kernels, NumPy fallbacks and batch output
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from core.robot_control import mock_hand_data
+from core.robot_control.mock_hand_data import MockHandDataGenerator
+
+MOTIONS = {
+    "wave": ("_wave_kernel", "generate_wave_motion"),
+    "point": ("_point_kernel", "generate_pointing_motion"),
+    "grab": ("_grab_kernel", "generate_grabbing_motion"),
+}
+TIMES = np.linspace(0.0, 12.0, 37)
+
+
+def single_frames(generator, method, times):
+    """Stack one generate_*_motion call per time (copied, since the buffer is shared)"""
+    return np.stack([getattr(generator, method)(t).copy() for t in times])
+
+
+class TestMockHandMotion(unittest.TestCase):
+    """Test that every motion implementation produces the same landmarks"""
+
+    def setUp(self):
+        self.generator = MockHandDataGenerator()
+
+    def fallback_frames(self, kernel, method):
+        with mock.patch.object(mock_hand_data, kernel, None):
+            return single_frames(self.generator, method, TIMES)
+
+    @unittest.skipIf(mock_hand_data.njit is None, "numba not installed")
+    def test_kernels_match_numpy_fallback(self):
+        for motion, (kernel, method) in MOTIONS.items():
+            with self.subTest(motion=motion):
+                compiled = single_frames(self.generator, method, TIMES)
+                np.testing.assert_allclose(compiled, self.fallback_frames(kernel, method), atol=1e-5)
+
+    def test_batch_matches_single_frames(self):
+        for motion, (kernel, method) in MOTIONS.items():
+            with self.subTest(motion=motion):
+                batch = self.generator.generate_batch(motion, TIMES)
+                self.assertEqual(batch.shape, (TIMES.size, 21, 3))
+                self.assertEqual(batch.dtype, np.float32)
+                np.testing.assert_allclose(batch, self.fallback_frames(kernel, method), atol=1e-5)
+
+    def test_static_batch_is_base_pose(self):
+        batch = self.generator.generate_batch("static", TIMES[:4])
+        np.testing.assert_array_equal(batch, np.repeat(self.generator.base_landmarks[None], 4, axis=0))
+
+    def test_current_pose_uses_scaled_time(self):
+        self.generator.set_motion_speed(2.0)
+        pose = self.generator.get_current_hand_pose("wave", now=1.5).copy()
+        np.testing.assert_allclose(pose, self.generator.generate_batch("wave", [3.0])[0], atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Unit tests for the shared-estimator predictor used by the API server
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from backend.serial_predictor import SerialPredictor
+
+
+class FakeEstimator:
+    """Records how many predictions run at once; frame "bad" raises"""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def predict(self, frame, hand="right"):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.01)
+            if frame == "bad":
+                raise ValueError("bad frame")
+            return [f"hands:{frame}"]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestSerialPredictor(unittest.TestCase):
+    """Test SerialPredictor ordering and error isolation"""
+
+    def test_concurrent_requests_run_one_at_a_time(self):
+        estimator = FakeEstimator()
+
+        async def run():
+            predictor = SerialPredictor(estimator)
+            return await asyncio.gather(*(predictor.predict(i) for i in range(5)))
+
+        results = asyncio.run(run())
+        self.assertEqual(results, [[f"hands:{i}"] for i in range(5)])
+        self.assertEqual(estimator.max_active, 1)
+
+    def test_failure_only_affects_its_own_frame(self):
+        async def run():
+            predictor = SerialPredictor(FakeEstimator())
+            return await asyncio.gather(
+                predictor.predict(1), predictor.predict("bad"), predictor.predict(2),
+                return_exceptions=True,
+            )
+
+        first, bad, second = asyncio.run(run())
+        self.assertEqual(first, ["hands:1"])
+        self.assertIsInstance(bad, ValueError)
+        self.assertEqual(second, ["hands:2"])
+
+
+if __name__ == "__main__":
+    unittest.main()